@@ -0,0 +1,10 @@
+"""Campus energy consumption analysis.
+
+Importing the package only loads pandas; matplotlib is imported when the
+dashboard is drawn and output directories are created when written to.
+"""
+
+from .config import DATA_DIR, OUTPUT_DIR, LOG_FILE, QUARANTINE_FILE, TIMESTAMP_COL, KWH_COL
+from .models import MeterReading, Building, BuildingManager
+from .validation import parse_meter_file, ParsedFile
+from .store import EnergyStore, write_store
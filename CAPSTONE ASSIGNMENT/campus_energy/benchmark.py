@@ -0,0 +1,85 @@
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .config import TIMESTAMP_COL, KWH_COL
+from .models import BuildingManager
+
+# Benchmark corpus: hourly readings of many buildings with a small share
+# of dirty rows, parsed by the validating ingest and by the old
+# read_csv(parse_dates) + to_numeric + dropna path for comparison.
+
+
+def write_corpus(directory, buildings=50, days=365, dirty=0.01, seed=0):
+    """Writes one hourly CSV per building, `dirty` of the rows corrupted.
+    Returns the number of data rows written."""
+    rng = np.random.default_rng(seed)
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    timestamps = pd.date_range('2024-01-01', periods=days * 24, freq=pd.offsets.Hour())
+    hours = timestamps.hour.to_numpy()
+    for b in range(buildings):
+        kwh = (100 + 60 * np.sin((hours - 6) / 24 * 2 * np.pi) + rng.normal(0, 10, len(hours))).round(3)
+        df = pd.DataFrame({TIMESTAMP_COL: timestamps.strftime('%Y-%m-%d %H:%M:%S'), KWH_COL: kwh.astype(str)})
+        bad = np.flatnonzero(rng.random(len(df)) < dirty)
+        kinds = rng.integers(0, 4, len(bad))
+        df.loc[bad[kinds == 0], KWH_COL] = 'ERR'
+        df.loc[bad[kinds == 1], TIMESTAMP_COL] = 'bad date'
+        df.loc[bad[kinds == 2], KWH_COL] = '-1'
+        df.loc[bad[kinds == 3], TIMESTAMP_COL] = df[TIMESTAMP_COL].shift(1)[bad[kinds == 3]]
+        df.to_csv(directory / f'Building_{b:04d}.csv', index=False)
+    return buildings * len(timestamps)
+
+
+def legacy_parse(data_dir):
+    """The ingest path before the validating parser, for comparison."""
+    all_data = []
+    for filepath in Path(data_dir).glob('*.csv'):
+        df = pd.read_csv(filepath, parse_dates=[TIMESTAMP_COL], on_bad_lines='skip', low_memory=False)
+        df['Building'] = filepath.stem
+        all_data.append(df)
+    df = pd.concat(all_data, ignore_index=True)
+    df = df.dropna(subset=['Building', TIMESTAMP_COL, KWH_COL])
+    df[KWH_COL] = pd.to_numeric(df[KWH_COL], errors='coerce')
+    df = df.dropna(subset=[KWH_COL])
+    df.sort_values(by=TIMESTAMP_COL, inplace=True)
+    return df
+
+
+def validated_parse(data_dir):
+    manager = BuildingManager(data_dir)
+    manager.ingest_data()
+    return manager.df_combined
+
+
+def best_time(func, *args, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Meter file parsing benchmark")
+    parser.add_argument("--buildings", type=int, default=50)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--dirty", type=float, default=0.01, help="share of corrupted rows")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        rows = write_corpus(directory, args.buildings, args.days, args.dirty)
+        print(f"Corpus: {args.buildings} buildings, {rows} rows, {args.dirty:.1%} dirty")
+        for name, func in (("legacy parse", legacy_parse), ("validating parse", validated_parse)):
+            seconds = best_time(func, directory, repeat=args.repeat)
+            print(f"{name:<17} {seconds:7.3f} s  {rows / seconds:12,.0f} rows/sec")
+
+
+if __name__ == "__main__":
+    main()
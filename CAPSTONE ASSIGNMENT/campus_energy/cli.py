@@ -0,0 +1,61 @@
+import argparse
+
+from .config import DATA_DIR, OUTPUT_DIR
+from .models import BuildingManager, DEDUP_POLICIES
+
+# --- Main Execution Block ---
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Campus energy consumption analysis")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="directory of building CSV files")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR, help="directory for the reports and dashboard")
+    parser.add_argument("--summary-only", action="store_true",
+                        help="print the executive summary without writing files or plotting")
+    parser.add_argument("--dedup", choices=DEDUP_POLICIES,
+                        help="keep repeated timestamps and resolve them this way (default: quarantine them)")
+    parser.add_argument("--freq", help="reading interval, e.g. 1h or 15min (default: inferred)")
+    parser.add_argument("--fill-gaps", action="store_true", help="interpolate missing readings")
+    parser.add_argument("--from-store", metavar="DIR",
+                        help="report from the energy store a full run wrote (e.g. output/energy_store) "
+                             "instead of reading the CSV files")
+    args = parser.parse_args(argv)
+
+    if args.from_store:
+        print("--- Opening the energy store (Tasks 1 & 2 already done) ---")
+        manager = BuildingManager.from_store(args.from_store, args.output_dir)
+        print("-" * 50)
+        if not manager.buildings:
+            print("The energy store has no buildings.")
+            return 1
+        return report(manager, args.summary_only)
+
+    manager = BuildingManager(args.data_dir, args.output_dir, dedup=args.dedup, freq=args.freq,
+                              fill='interpolate' if args.fill_gaps else None)
+
+    print("--- Starting Task 1: Data Ingestion and Validation ---")
+    manager.ingest_data()
+    print("-" * 50)
+
+    if manager.df_combined.empty:
+        print("Script terminated due to failure in Task 1 (No data ingested).")
+        return 1
+
+    print("--- Starting Task 2 & 3: Core Aggregation and OOP Modeling ---")
+    manager.process_data()
+    print("-" * 50)
+    return report(manager, args.summary_only)
+
+
+def report(manager, summary_only=False):
+    if summary_only:
+        print("\n" + manager.executive_summary())
+        return 0
+
+    print("--- Starting Task 4: Visual Output with Matplotlib ---")
+    manager.generate_visual_dashboard()
+    print("-" * 50)
+
+    print("--- Starting Task 5: Persistence and Executive Summary ---")
+    manager.generate_reports()
+    print("-" * 50)
+    return 0
@@ -0,0 +1,13 @@
+from pathlib import Path
+
+# --- Configuration ---
+# Directories are only created when something is written to them, so
+# importing the package has no side effects on the working directory.
+DATA_DIR = Path('data/')
+OUTPUT_DIR = Path('output/')
+LOG_FILE = OUTPUT_DIR / 'processing_log.txt'
+QUARANTINE_FILE = OUTPUT_DIR / 'quarantine.csv'
+
+# Sample column names expected in the CSV files
+TIMESTAMP_COL = 'Timestamp'
+KWH_COL = 'Energy_kwh'
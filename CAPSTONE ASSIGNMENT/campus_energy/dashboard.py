@@ -0,0 +1,48 @@
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+# Kept out of models.py so that matplotlib is only imported when a
+# dashboard is drawn; summaries and reports never load it.
+
+def save_dashboard(daily_trends, weekly_means, peak_consumption, dashboard_path):
+    """Draws the three dashboard charts into one figure and saves it.
+    peak_consumption is the highest reading of each hour."""
+    # Use plt.subplots() to create a unified figure (Task 4)
+    fig, axes = plt.subplots(3, 1, figsize=(14, 18))
+    fig.suptitle('Campus Energy Consumption Dashboard', fontsize=20, y=1.02)
+
+    # 1. Trend Line – daily consumption over time for all buildings (Task 4)
+    daily_trends.plot(ax=axes[0], kind='line')
+    axes[0].set_title('Daily Total Consumption Trend Over Time')
+    axes[0].set_ylabel('Total Consumption (kWh)')
+    axes[0].legend(title='Building')
+    axes[0].grid(True, linestyle='--', alpha=0.6)
+
+    # 2. Bar Chart – compare average weekly usage across buildings (Task 4)
+    avg_weekly_usage = weekly_means.mean(skipna=True).sort_values(ascending=False)
+    # Clean index for display
+    avg_weekly_usage.index = [idx.replace('_Weekly_Mean', '') for idx in avg_weekly_usage.index]
+
+    avg_weekly_usage.plot(ax=axes[1], kind='bar')
+    axes[1].set_title('Average Weekly Consumption per Building')
+    axes[1].set_ylabel('Average Weekly Usage (kWh)')
+    axes[1].set_xlabel('Building Name')
+    axes[1].tick_params(axis='x', rotation=45)
+    axes[1].grid(axis='y', linestyle='--', alpha=0.6)
+
+    # 3. Scatter Plot – plot peak-hour consumption vs. time/building (Task 4)
+    # (hourly maxima from BuildingManager.aggregate, so the raw readings
+    # need not be loaded to draw them)
+    axes[2].scatter(peak_consumption.index, peak_consumption.values, alpha=0.7, s=50, c='red')
+    axes[2].set_title('Hourly Peak Consumption Events (Scatter Plot)')
+    axes[2].set_ylabel('Peak Consumption (kWh)')
+    axes[2].set_xlabel('Time')
+    axes[2].grid(True, linestyle='--', alpha=0.6)
+
+    # Save the chart as dashboard.png (Task 4)
+    dashboard_path.parent.mkdir(parents=True, exist_ok=True)
+    plt.tight_layout(rect=[0, 0, 1, 0.98])
+    plt.savefig(dashboard_path)
+    plt.close(fig)
+    return dashboard_path
@@ -0,0 +1,472 @@
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+from .config import DATA_DIR, OUTPUT_DIR, LOG_FILE, QUARANTINE_FILE, TIMESTAMP_COL, KWH_COL
+from .validation import parse_meter_file, OUTLIER_MADS, QUARANTINE_COLUMNS
+from . import store as energy_store
+
+# --- Task 3: Object-Oriented Modeling (Classes for Data Management) ---
+
+class MeterReading:
+    """Represents a single energy meter reading."""
+    def __init__(self, timestamp, kwh):
+        self.timestamp = pd.to_datetime(timestamp)
+        self.kwh = float(kwh)
+
+DEDUP_POLICIES = ('last', 'mean', 'max')
+
+class Building:
+    """Models a single campus building and its energy data."""
+    def __init__(self, name):
+        self.name = name
+        self.meter_readings = []
+        self.df = pd.DataFrame() # DataFrame to store combined, cleaned data
+        self.freq = None          # reading interval, set by normalize()
+        self.readings = None      # Series of 1 per distinct reading time (before filling)
+        self.gaps = pd.DataFrame(columns=['Start', 'End', 'Missing'])
+        self.normalize_stats = {'Duplicates': 0, 'Gaps': 0, 'Missing': 0, 'Filled': 0}
+
+    # NOTE: add_reading is primarily for conceptual OOP modeling (not used in Pandas-based analysis)
+    def add_reading(self, timestamp, kwh):
+        """Adds a MeterReading object."""
+        self.meter_readings.append(MeterReading(timestamp, kwh))
+
+    # FIX INCORPORATED HERE for robust column selection
+    def load_data(self, df_building):
+        """Loads and cleans the building's data from the combined DataFrame."""
+        self.df = df_building.copy()
+        
+        # Select the necessary columns (TIMESTAMP_COL is now a regular column due to reset_index in Manager)
+        self.df = self.df[[TIMESTAMP_COL, KWH_COL]].rename(columns={KWH_COL: 'Consumption_kwh'})
+        
+        # Data type conversion and validation
+        self.df['Consumption_kwh'] = pd.to_numeric(self.df['Consumption_kwh'], errors='coerce')
+        self.df = self.df.dropna(subset=['Consumption_kwh'])
+        
+        # Set the index here, right before the Building object uses it for resample/groupby
+        self.df.set_index(TIMESTAMP_COL, inplace=True)
+        # data from the manager is already in time order, only sort when it isn't
+        if not self.df.index.is_monotonic_increasing:
+            self.df.sort_index(inplace=True, kind='stable')
+
+    def normalize(self, dedup='last', freq=None, fill=None, limit=None):
+        """Collapses repeated timestamps and finds gaps in the readings.
+
+        dedup: which reading of a repeated timestamp is kept, 'last', or
+        'mean' / 'max' of them. freq: the reading interval (default: the
+        most common spacing). fill='interpolate' fills missing intervals
+        (at most `limit` in a row) by time interpolation. Expects load_data
+        to have been called, so the index is in time order and one linear
+        pass suffices. Returns counts of duplicates, gaps and filled values.
+        """
+        if dedup not in DEDUP_POLICIES:
+            raise ValueError(f"Unknown dedup policy {dedup!r}, expected one of {', '.join(DEDUP_POLICIES)}")
+        if self.df.empty:
+            return self.normalize_stats
+
+        times = self.df.index.to_numpy()
+        values = self.df['Consumption_kwh'].to_numpy(dtype=np.float64)
+
+        # 1. Dedup: equal timestamps are neighbours in sorted data
+        starts = np.flatnonzero(np.concatenate(([True], times[1:] != times[:-1])))
+        duplicates = len(times) - len(starts)
+        if duplicates:
+            if dedup == 'last':
+                values = values[np.append(starts[1:], len(values)) - 1]
+            elif dedup == 'mean':
+                values = np.add.reduceat(values, starts) / np.diff(np.append(starts, len(times)))
+            else:
+                values = np.maximum.reduceat(values, starts)
+            times = times[starts]
+
+        # 2. Gaps: spacing wider than the reading interval
+        steps = np.diff(times)
+        if freq is None:
+            freq = pd.Timedelta(pd.Series(steps).mode().iloc[0]) if len(steps) else pd.Timedelta(hours=1)
+        self.freq = pd.Timedelta(freq)
+        wide = np.flatnonzero(steps > self.freq.to_timedelta64())
+        missing = (steps[wide] // self.freq.to_timedelta64()) - 1
+        self.gaps = pd.DataFrame({
+            'Start': times[wide] + self.freq.to_timedelta64(),
+            'End': times[wide + 1] - self.freq.to_timedelta64(),
+            'Missing': missing.astype(np.int64),
+        })
+
+        index = pd.DatetimeIndex(times, name=TIMESTAMP_COL)
+        self.readings = pd.Series(1, index=index)
+        series = pd.Series(values, index=index, name='Consumption_kwh')
+
+        # 3. Optional filling of the missing intervals
+        filled = 0
+        if fill == 'interpolate' and len(wide):
+            grid = pd.date_range(index[0], index[-1], freq=self.freq, name=TIMESTAMP_COL)
+            series = series.reindex(grid).interpolate(method='time', limit=limit, limit_area='inside')
+            filled = int(series.notna().sum()) - len(index)
+            series = series.dropna()
+        elif fill not in (None, 'interpolate'):
+            raise ValueError(f"Unknown fill method {fill!r}, expected None or 'interpolate'")
+
+        self.df = series.to_frame()
+        self.normalize_stats = {'Duplicates': duplicates, 'Gaps': len(wide),
+                                'Missing': int(missing.sum()), 'Filled': filled}
+        return self.normalize_stats
+
+    def expected_readings(self):
+        """Readings expected at self.freq from the first to the last one."""
+        if self.readings is None:
+            self.normalize()
+        if self.readings.empty:
+            return 0
+        return (self.readings.index[-1] - self.readings.index[0]) // self.freq + 1
+
+    def _coverage(self, rule, length):
+        # share of the readings expected at self.freq that were really taken
+        # (filled values don't count), per calendar day / week
+        if self.readings is None:
+            self.normalize()
+        return (self.readings.resample(rule).sum() / (length / self.freq)).rename(f'{self.name}_Coverage')
+
+    def calculate_daily_coverage(self):
+        """Fraction of expected readings present on each day."""
+        return self._coverage('D', pd.Timedelta(days=1))
+
+    def calculate_weekly_coverage(self):
+        """Fraction of expected readings present in each week."""
+        return self._coverage('W', pd.Timedelta(days=7))
+
+    def calculate_total_consumption(self):
+        """Calculates the total energy consumed by the building."""
+        if not self.df.empty:
+            return self.df['Consumption_kwh'].sum()
+        return 0
+
+    # Task 2 function
+    def calculate_daily_totals(self):
+        """Resamples data to daily totals."""
+        # Use .resample('D') for daily totals (Task 2)
+        return self.df['Consumption_kwh'].resample('D').sum().rename(f'{self.name}_Daily')
+
+    # Task 2 function
+    def calculate_weekly_aggregates(self):
+        """Resamples data to weekly aggregates (mean, total)."""
+        # Use .resample('W') for weekly aggregates (Task 2)
+        weekly_data = self.df['Consumption_kwh'].resample('W').agg(['sum', 'mean']).rename(
+            columns={'sum': f'{self.name}_Weekly_Total', 'mean': f'{self.name}_Weekly_Mean'}
+        )
+        return weekly_data
+
+    # Task 2 function
+    def building_wise_summary(self):
+        """Generates a summary dictionary for the building."""
+        if self.df.empty:
+            return {'Total_kwh': 0, 'Mean_kwh': 0, 'Min_kwh': 0, 'Max_kwh': 0, 'Peak_Load_Time': 'N/A'}
+        
+        summary = {
+            'Total_kwh': self.df['Consumption_kwh'].sum(),
+            'Mean_kwh': self.df['Consumption_kwh'].mean(),
+            'Min_kwh': self.df['Consumption_kwh'].min(),
+            'Max_kwh': self.df['Consumption_kwh'].max()
+        }
+        # Find time of peak load
+        peak_time = self.df['Consumption_kwh'].idxmax()
+        if peak_time is not None:
+             # Ensure the peak time is formatted correctly
+             summary['Peak_Load_Time'] = peak_time.strftime('%Y-%m-%d %H:%M')
+        else:
+             summary['Peak_Load_Time'] = 'N/A'
+             
+        return summary
+
+    def generate_report(self):
+        """Placeholder for generating a building-specific report."""
+        summary = self.building_wise_summary()
+        report = f"--- Report for {self.name} ---\n"
+        report += f"Total Consumption: {summary['Total_kwh']:.2f} kWh\n"
+        report += f"Average Consumption: {summary['Mean_kwh']:.2f} kWh\n"
+        report += f"Peak Load: {summary['Max_kwh']:.2f} kWh at {summary.get('Peak_Load_Time', 'N/A')}\n"
+        return report
+
+class BuildingManager:
+    """Manages all Building objects and performs campus-wide analysis."""
+    def __init__(self, data_dir=DATA_DIR, output_dir=OUTPUT_DIR, outlier_mads=OUTLIER_MADS,
+                 dedup=None, freq=None, fill=None):
+        self.data_dir = Path(data_dir)
+        self.outlier_mads = outlier_mads
+        # dedup=None quarantines repeated timestamps while parsing; with a
+        # policy they are kept and resolved by Building.normalize
+        self.dedup = dedup
+        self.freq = freq
+        self.fill = fill
+        self.output_dir = Path(output_dir)
+        self.log_file = self.output_dir / LOG_FILE.name
+        self.buildings = {}
+        self.df_combined = pd.DataFrame()
+        self.daily_trends = pd.DataFrame()
+        self.weekly_means = pd.DataFrame()
+        self.weekly_totals = pd.DataFrame()
+        self.daily_coverage = pd.DataFrame()
+        self.weekly_coverage = pd.DataFrame()
+        self.hourly_peak = pd.Series(dtype=float)
+        self.summary_table = pd.DataFrame()
+        self.quarantine = pd.DataFrame(columns=QUARANTINE_COLUMNS)
+        self.log_messages = []
+        self.store = None           # EnergyStore the buildings were opened from
+
+    # --- Task 1: Data Ingestion and Validation ---
+    def ingest_data(self):
+        """
+        Automatically reads multiple CSV files and combines them into one clean DataFrame.
+        Every file goes through the validating parser: rejected rows are counted in the
+        log and kept in self.quarantine with the reason.
+        """
+        all_data = []
+        rejected = []
+        csv_files = sorted(self.data_dir.glob('*.csv'))
+
+        if not csv_files:
+            self.log_messages.append(f"ERROR: No CSV files found in {self.data_dir}. Cannot proceed.")
+            print(self.log_messages[-1])
+            return
+
+        for filepath in csv_files:
+            try:
+                parsed = parse_meter_file(filepath, self.outlier_mads,
+                                          keep_duplicates=self.dedup is not None)
+            except FileNotFoundError:
+                # Handle exceptions: Missing files (Task 1)
+                self.log_messages.append(f"ERROR: File {filepath.name} not found.")
+                continue
+            except ValueError as e:
+                self.log_messages.append(f"WARNING: File {filepath.name} skipped. {e}")
+                continue
+            except Exception as e:
+                self.log_messages.append(f"ERROR: An unexpected error occurred reading {filepath.name}: {e}")
+                continue
+
+            # Add metadata (Task 1), file name without extension is the building name
+            parsed.data['Building'] = parsed.name
+            all_data.append(parsed.data)
+            if parsed.rejected_count:
+                rejected.append(parsed.rejected)
+            self.log_messages.append(f"SUCCESS: Read {filepath.name}: {parsed.describe()}.")
+
+        if rejected:
+            self.quarantine = pd.concat(rejected, ignore_index=True)
+        total_rejected = len(self.quarantine)
+
+        if all_data:
+            # Combine all data into a single merged DataFrame (already validated)
+            self.df_combined = pd.concat(all_data, ignore_index=True)
+            # Ensure final data is sorted by time for consistent resampling
+            self.df_combined.sort_values(by=TIMESTAMP_COL, inplace=True, kind='stable')
+            self.log_messages.append(
+                f"SUMMARY: {len(self.df_combined)} rows accepted, {total_rejected} rows quarantined.")
+            print(self.log_messages[-1])
+            print("Data Ingestion and Validation Complete.")
+        else:
+            print("No data was successfully ingested.")
+
+
+    @classmethod
+    def from_store(cls, store_dir, output_dir=OUTPUT_DIR):
+        """A manager with the buildings of an energy store (see store.py)
+        already aggregated, without reading or validating any CSV."""
+        manager = cls(output_dir=output_dir)
+        manager.store = energy_store.EnergyStore(store_dir)
+        manager.buildings = {name: manager.store.building(name) for name in manager.store.names}
+        manager.log_messages = list(manager.store.catalog.get('log', []))
+        manager.log_messages.append(
+            f"SUCCESS: Opened {len(manager.buildings)} buildings from the energy store {manager.store.store_dir}.")
+        print(manager.log_messages[-1])
+        if manager.buildings:
+            manager.aggregate()
+        return manager
+
+    def write_store(self, store_dir=None):
+        """Saves the normalized buildings as a memory-mappable energy store
+        (default output_dir/energy_store) and returns the catalog path."""
+        store_dir = self.output_dir / energy_store.STORE_DIR.name if store_dir is None else store_dir
+        return energy_store.write_store(self.buildings, store_dir, log=self.log_messages)
+
+
+    # --- Task 2: Core Aggregation Logic (Implemented within Manager/Building) ---
+    def process_data(self):
+        """Initializes Building objects and runs aggregation functions."""
+        if self.df_combined.empty:
+            return
+
+        # Group by the 'Building' metadata column
+        for name, group_df in self.df_combined.groupby('Building'):
+            building = Building(name)
+            
+            # Calls load_data which now successfully selects columns and sets the index
+            building.load_data(group_df) 
+            # Dedup repeated timestamps, find (and optionally fill) gaps
+            building.normalize(self.dedup or 'last', self.freq, self.fill)
+            self.buildings[name] = building
+
+        self.aggregate()
+        print("Data Processing and Aggregation Complete.")
+
+    def aggregate(self):
+        """Daily/weekly aggregates, coverage and summaries of self.buildings
+        (after process_data, or buildings opened from an energy store)."""
+        daily_trends, weekly_means, weekly_totals = [], [], []
+        daily_coverage, weekly_coverage, hourly_peaks = [], [], []
+        all_summaries = {}
+
+        for name, building in self.buildings.items():
+            # Calculate and combine daily/weekly aggregates (Task 2)
+            daily = building.calculate_daily_totals()
+            weekly = building.calculate_weekly_aggregates()
+
+            daily_trends.append(daily)
+            weekly_means.append(weekly[f'{name}_Weekly_Mean'])
+            weekly_totals.append(weekly[f'{name}_Weekly_Total'])
+            daily_coverage.append(building.calculate_daily_coverage())
+            weekly_coverage.append(building.calculate_weekly_coverage())
+            hourly_peaks.append(building.df['Consumption_kwh'].resample(pd.offsets.Hour()).max())
+
+            # Store results in Dictionaries for building summaries (Task 2)
+            all_summaries[name] = building.building_wise_summary()
+            all_summaries[name]['Coverage_Pct'] = 100 * building.readings.sum() / building.expected_readings()
+            all_summaries[name].update(building.normalize_stats)
+
+        # One outer join per table instead of a merge per building
+        self.daily_trends = pd.concat(daily_trends, axis=1)
+        self.weekly_means = pd.concat(weekly_means, axis=1)
+        self.weekly_totals = pd.concat(weekly_totals, axis=1)
+        self.daily_coverage = pd.concat(daily_coverage, axis=1)
+        self.weekly_coverage = pd.concat(weekly_coverage, axis=1)
+        # Highest reading of any building in every hour, for the dashboard
+        self.hourly_peak = pd.concat(hourly_peaks, axis=1).max(axis=1).dropna()
+        # Convert summaries to a DataFrame
+        self.summary_table = pd.DataFrame.from_dict(all_summaries, orient='index')
+
+
+    # --- Task 4: Visual Output with Matplotlib ---
+    def generate_visual_dashboard(self):
+        """Generates multiple plots in a dashboard-style layout and
+        returns the path of the saved figure."""
+        if self.daily_trends.empty or self.weekly_means.empty or self.hourly_peak.empty:
+            self.log_messages.append("ERROR: Cannot generate visuals. Aggregated data is missing.")
+            print(self.log_messages[-1])
+            return
+
+        # matplotlib is only imported when a dashboard is actually drawn
+        from .dashboard import save_dashboard
+        dashboard_path = save_dashboard(self.daily_trends, self.weekly_means, self.hourly_peak,
+                                        self.output_dir / 'dashboard.png')
+        print(f"Visual dashboard saved to {dashboard_path}.")
+        return dashboard_path
+
+
+    # --- Task 5: Persistence and Executive Summary ---
+    def executive_summary(self):
+        """Builds the text of the executive summary report."""
+        # Calculate key metrics for the summary
+        total_campus_consumption = self.summary_table['Total_kwh'].sum()
+        highest_consuming_building = self.summary_table['Total_kwh'].idxmax()
+        highest_consumption = self.summary_table['Total_kwh'].max()
+        
+        # Find absolute peak load time from the combined data
+        if not self.df_combined.empty:
+            peak_load_value_idx = self.df_combined[KWH_COL].idxmax()
+            peak_load_time = self.df_combined.loc[peak_load_value_idx, TIMESTAMP_COL].strftime('%Y-%m-%d %H:%M')
+            peak_load_value = self.df_combined.loc[peak_load_value_idx, KWH_COL]
+        elif not self.summary_table.empty:
+            # no raw readings loaded (report from an energy store)
+            peak_building = self.summary_table['Max_kwh'].idxmax()
+            peak_load_time = self.summary_table.loc[peak_building, 'Peak_Load_Time']
+            peak_load_value = self.summary_table.loc[peak_building, 'Max_kwh']
+        else:
+             peak_load_time = 'N/A'
+             peak_load_value = 0
+
+        # Trends
+        daily_total_consumption = self.daily_trends.sum(axis=1)
+        if daily_total_consumption.shape[0] > 1:
+            daily_growth_rate = daily_total_consumption.pct_change().mean() * 100
+        else:
+            daily_growth_rate = 0.0
+
+        trend_statement = "Campus-wide daily consumption shows an average growth of" if daily_growth_rate > 0 else "Campus-wide daily consumption shows an average change of"
+        
+        summary_report = "--- Executive Energy Summary Report ---\n\n"
+        summary_report += f"1. Total Campus Consumption: {total_campus_consumption:.2f} kWh\n"
+        summary_report += f"2. Highest-Consuming Building: **{highest_consuming_building}** ({highest_consumption:.2f} kWh)\n"
+        summary_report += f"3. Peak Load Event: **{peak_load_value:.2f} kWh** occurred at {peak_load_time}\n"
+        summary_report += f"4. Weekly/Daily Trends: {trend_statement} **{abs(daily_growth_rate):.2f}%**.\n"
+        if 'Coverage_Pct' in self.summary_table:
+            summary_report += (f"5. Data Coverage: {self.summary_table['Coverage_Pct'].min():.1f}% - "
+                               f"{self.summary_table['Coverage_Pct'].max():.1f}% of expected readings per building "
+                               f"({int(self.summary_table['Gaps'].sum())} gaps, "
+                               f"{int(self.summary_table['Duplicates'].sum())} repeated timestamps resolved)\n")
+        summary_report += "---------------------------------------\n\n"
+        summary_report += "Detailed Building Summaries (mean, min, max, total):\n"
+        summary_report += self.summary_table.to_string(float_format='%.2f')
+        return summary_report
+
+    def generate_reports(self):
+        """Exports data and creates the written summary report.
+
+        Returns the paths of the files written."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        written = []
+
+        # 1. Export Final processed dataset (Task 5)
+        if not self.df_combined.empty:
+            cleaned_path = self.output_dir / 'cleaned_energy_data.csv'
+            # Reset index before export to save 'Timestamp' as a column
+            self.df_combined.reset_index(drop=True).to_csv(cleaned_path, index=False)
+            written.append(cleaned_path)
+            print(f"Cleaned energy data exported to {cleaned_path}.")
+        
+        # 2. Export Summary stats (Task 5)
+        if not self.summary_table.empty:
+            summary_path = self.output_dir / 'building_summary.csv'
+            self.summary_table.to_csv(summary_path)
+            written.append(summary_path)
+            print(f"Building summary exported to {summary_path}.")
+            
+        # Daily / weekly totals next to the share of readings they are based on
+        if not self.daily_coverage.empty:
+            daily_path = self.output_dir / 'daily_coverage.csv'
+            pd.concat([self.daily_trends, self.daily_coverage], axis=1).to_csv(daily_path)
+            weekly_path = self.output_dir / 'weekly_coverage.csv'
+            pd.concat([self.weekly_totals, self.weekly_coverage], axis=1).to_csv(weekly_path)
+            written += [daily_path, weekly_path]
+            print(f"Daily and weekly coverage exported to {daily_path} and {weekly_path}.")
+
+        # Cleaned readings for other tools to memory map instead of re-parsing
+        if self.buildings and self.store is None:
+            catalog_path = self.write_store()
+            written.append(catalog_path)
+            print(f"Energy store of {len(self.buildings)} buildings saved to {catalog_path.parent}.")
+
+        # Rejected rows with the reason, so nothing is dropped silently (Task 1)
+        # (a report from an energy store keeps the ingest run's quarantine file)
+        if self.store is None:
+            quarantine_path = self.output_dir / QUARANTINE_FILE.name
+            self.quarantine.to_csv(quarantine_path, index=False)
+            written.append(quarantine_path)
+            print(f"{len(self.quarantine)} rejected rows saved to {quarantine_path}.")
+
+        # 3. Create a short summary report (summary.txt) (Task 5)
+        summary_txt_path = self.output_dir / 'summary.txt'
+        summary_report = self.executive_summary()
+        
+        with open(summary_txt_path, 'w') as f:
+            f.write(summary_report)
+            
+        # Print summary to console (Task 5)
+        print("\n" + summary_report)
+        print(f"Executive summary saved to {summary_txt_path}.")
+        
+        # Log any issues encountered during Task 1 (Task 1)
+        with open(self.log_file, 'w') as f:
+            f.write("--- Data Processing Log ---\n")
+            f.write("\n".join(self.log_messages))
+        print(f"Processing log saved to {self.log_file}.")
+        return written + [summary_txt_path, self.log_file]
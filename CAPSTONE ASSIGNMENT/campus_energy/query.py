@@ -0,0 +1,32 @@
+import argparse
+import time
+
+from .store import EnergyStore, STORE_DIR
+
+# Ad-hoc queries against the energy store written by a full run: opens the
+# memory-mapped arrays instead of re-reading any CSV.
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the shared energy store")
+    parser.add_argument("store", nargs="?", default=STORE_DIR)
+    parser.add_argument("--building", help="building to query (default: list all)")
+    parser.add_argument("--start", help="first timestamp, e.g. 2024-10-05")
+    parser.add_argument("--end", help="end timestamp (exclusive)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    store = EnergyStore(args.store)
+    if args.building and args.building not in store:
+        parser.error(f"no building {args.building!r} in {args.store}")
+    names = [args.building] if args.building else store.names
+    print(f"{'Building':<24} {'Rows':>8} {'Total_kwh':>12} {'Max_kwh':>9}")
+    for name in names:
+        series = store.series(name, args.start, args.end)
+        peak = series.max() if len(series) else 0
+        print(f"{name:<24} {len(series):>8} {series.sum():>12.2f} {peak:>9.2f}")
+    print(f"Queried {len(names)} buildings in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
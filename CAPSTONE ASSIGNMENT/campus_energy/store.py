@@ -0,0 +1,172 @@
+import json
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .config import OUTPUT_DIR, TIMESTAMP_COL
+
+# --- Shared on-disk dataset of the cleaned readings ---
+# One set of plain .npy arrays per building (timestamps as int64 ns, kWh as
+# float64, and which readings were observed rather than filled) plus a
+# small catalog.json. Arrays are opened with np.load(mmap_mode='r'), so any
+# number of processes share the same pages of the OS cache without parsing
+# or copying anything.
+#
+# Every write uses new file names (a generation number) and replaces the
+# catalog last, so a reader always sees one complete version. A reader maps
+# all arrays of its generation when it opens the store, and mapped files stay
+# readable after they are deleted. The previous generation is kept for
+# readers that have read the old catalog but not mapped its files yet; only
+# older ones are removed.
+
+STORE_DIR = OUTPUT_DIR / 'energy_store'
+CATALOG = 'catalog.json'
+FORMAT_VERSION = 1
+COLUMNS = ('timestamps', 'kwh', 'observed')
+
+
+def _safe_name(name):
+    return "".join(c if c.isalnum() or c in '-_.' else '_' for c in name)
+
+
+def _generation(file_name):
+    # '<name>-<generation>.<column>.npy', None for files of another layout
+    stem, _, generation = file_name.rsplit('.', 2)[0].rpartition('-')
+    return int(generation) if stem and generation.isdigit() else None
+
+
+def write_store(buildings, store_dir=STORE_DIR, log=()):
+    """Writes the normalized data of {name: Building} (and the ingest log)
+    and returns the catalog path.
+
+    Raises ValueError when two building names map to the same file name."""
+    file_names = {}
+    for name in buildings:
+        other = file_names.setdefault(_safe_name(name), name)
+        if other != name:
+            raise ValueError(f"Buildings {other!r} and {name!r} would share the store files "
+                             f"{_safe_name(name)}-*.npy")
+
+    store_dir = Path(store_dir)
+    store_dir.mkdir(parents=True, exist_ok=True)
+    catalog_path = store_dir / CATALOG
+    generation = 1
+    if catalog_path.exists():
+        with open(catalog_path) as f:
+            generation = json.load(f).get('generation', 0) + 1
+
+    entries = {}
+    for name, building in buildings.items():
+        series = building.df['Consumption_kwh']
+        timestamps = series.index.to_numpy().astype('datetime64[ns]').view(np.int64)
+        observed = np.ones(len(timestamps), dtype=bool)
+        if building.readings is not None and len(building.readings) != len(timestamps):
+            # filled values are not observed readings (for coverage)
+            observed = np.isin(timestamps, building.readings.index.to_numpy()
+                               .astype('datetime64[ns]').view(np.int64), assume_unique=True)
+        files = {}
+        for column, values in zip(COLUMNS, (timestamps, series.to_numpy(dtype=np.float64), observed)):
+            file_name = f'{_safe_name(name)}-{generation}.{column}.npy'
+            np.save(store_dir / file_name, np.ascontiguousarray(values))
+            files[column] = file_name
+        entries[name] = {
+            'rows': len(timestamps),
+            'start': str(series.index[0]) if len(series) else None,
+            'end': str(series.index[-1]) if len(series) else None,
+            'freq': str(building.freq) if building.freq is not None else None,
+            'normalize_stats': {key: int(value) for key, value in building.normalize_stats.items()},
+            'files': files,
+        }
+
+    catalog = {'version': FORMAT_VERSION, 'generation': generation,
+               'written': time.strftime('%Y-%m-%d %H:%M:%S'), 'log': list(log),
+               'buildings': entries}
+    tmp_path = catalog_path.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(catalog, f, indent=1)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, catalog_path)
+
+    # keep this generation and the one before it
+    for path in store_dir.glob('*.npy'):
+        old = _generation(path.name)
+        if old is not None and old < generation - 1:
+            path.unlink(missing_ok=True)
+    return catalog_path
+
+
+class EnergyStore:
+    """Read-only view of a store written by write_store.
+
+    Opening reads the catalog and memory maps every array of that version
+    (no data is read until it is used), so later writes can't take the
+    files away from under the reader.
+    """
+    def __init__(self, store_dir=STORE_DIR):
+        self.store_dir = Path(store_dir)
+        try:
+            self._open()
+        except FileNotFoundError:
+            # two writes between reading the catalog and mapping its files
+            self._open()
+
+    def _open(self):
+        with open(self.store_dir / CATALOG) as f:
+            self.catalog = json.load(f)
+        if self.catalog.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported energy store version {self.catalog.get('version')}")
+        self._arrays = {}
+        for name, entry in self.catalog['buildings'].items():
+            for column in COLUMNS:
+                values = np.load(self.store_dir / entry['files'][column], mmap_mode='r')
+                if column == 'timestamps':
+                    values = values.view('datetime64[ns]')
+                self._arrays[name, column] = values
+
+    @property
+    def names(self):
+        return list(self.catalog['buildings'])
+
+    def __contains__(self, name):
+        return name in self.catalog['buildings']
+
+    def __len__(self):
+        return len(self.catalog['buildings'])
+
+    def array(self, name, column):
+        """The memory-mapped 'timestamps', 'kwh' or 'observed' array."""
+        return self._arrays[name, column]
+
+    def series(self, name, start=None, end=None):
+        """kWh of one building as a Series over the mapped arrays, limited
+        to start <= time < end with a binary search (no copy)."""
+        timestamps = self.array(name, 'timestamps')
+        kwh = self.array(name, 'kwh')
+        lo = np.searchsorted(timestamps, np.datetime64(pd.Timestamp(start), 'ns')) if start else 0
+        hi = np.searchsorted(timestamps, np.datetime64(pd.Timestamp(end), 'ns')) if end else len(timestamps)
+        index = pd.DatetimeIndex(timestamps[lo:hi], name=TIMESTAMP_COL)
+        return pd.Series(kwh[lo:hi], index=index, name='Consumption_kwh', copy=False)
+
+    def building(self, name):
+        """A Building with its data (and normalize results) from the store."""
+        from .models import Building
+
+        entry = self.catalog['buildings'][name]
+        building = Building(name)
+        series = self.series(name)
+        building.df = series.to_frame()
+        building.freq = pd.Timedelta(entry['freq']) if entry['freq'] else None
+        observed = np.asarray(self.array(name, 'observed'))
+        building.readings = pd.Series(1, index=series.index[observed])
+        building.normalize_stats = dict(entry['normalize_stats'])
+        return building
+
+    def daily_energy(self):
+        """Daily kWh of every building (days x buildings), e.g. for the
+        weather join."""
+        return pd.concat({name: self.series(name).resample('D').sum() for name in self.names}, axis=1)
+
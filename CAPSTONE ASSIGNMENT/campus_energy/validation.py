@@ -0,0 +1,158 @@
+import csv
+import io
+
+import numpy as np
+import pandas as pd
+
+from .config import TIMESTAMP_COL, KWH_COL
+
+# --- Task 1: Validating parser for meter CSV files ---
+# Every row of a file is classified in one vectorized pass instead of being
+# dropped silently, and the rejected rows are kept (with the reason) for the
+# quarantine file.
+
+REASONS = ['bad_timestamp', 'bad_kwh', 'negative_kwh', 'outlier_kwh', 'duplicate_timestamp']
+MALFORMED = 'malformed_line'
+
+# readings above median + OUTLIER_MADS * (scaled) median absolute deviation
+# of the file are treated as meter faults
+OUTLIER_MADS = 10
+QUARANTINE_COLUMNS = ['File', 'Line', 'Reason', TIMESTAMP_COL, KWH_COL]
+
+
+class ParsedFile:
+    """Result of parse_meter_file: the valid rows, the rejected rows and
+    the number of rows per reason."""
+    def __init__(self, name, data, rejected, counts, repeated=0):
+        self.name = name
+        self.data = data
+        self.rejected = rejected
+        self.counts = counts
+        self.repeated = repeated    # repeated timestamps kept for dedup
+
+    @property
+    def rejected_count(self):
+        return sum(self.counts.values())
+
+    def describe(self):
+        reasons = ", ".join(f"{reason} {count}" for reason, count in self.counts.items() if count)
+        text = f"{len(self.data)} rows ok, {self.rejected_count} rejected"
+        text = f"{text} ({reasons})" if reasons else text
+        if self.repeated:
+            text += f", {self.repeated} repeated timestamps kept for dedup"
+        return text
+
+
+def _parse_timestamps(values):
+    # ISO 8601 is parsed by the fast path; other layouts fall back to inference
+    # (readings rarely repeat a timestamp, so pandas' value cache only costs time)
+    timestamps = pd.to_datetime(values, errors='coerce', format='ISO8601', cache=False)
+    if timestamps.isna().mean() > 0.5 and values.notna().any():
+        inferred = pd.to_datetime(values, errors='coerce')
+        if inferred.isna().sum() < timestamps.isna().sum():
+            timestamps = inferred
+    return timestamps
+
+
+def _malformed_lines(raw, parsed_rows):
+    """Line numbers of the rows pandas kept, and (line, text) of the lines
+    it skipped for having too many fields. Only needed when some were."""
+    lines = raw.decode('utf-8', errors='replace').splitlines()
+    width = len(next(csv.reader(lines[:1]), []))
+    kept, malformed = [], []
+    for number, (text, row) in enumerate(zip(lines[1:], csv.reader(lines[1:])), start=2):
+        if not row:
+            continue
+        if len(row) > width:
+            malformed.append((number, text))
+        else:
+            kept.append(number)
+    if len(kept) != parsed_rows:
+        kept = None
+    return kept, malformed
+
+
+def parse_meter_file(filepath, outlier_mads=OUTLIER_MADS, keep_duplicates=False):
+    """Reads one meter CSV and sorts its rows into valid and rejected.
+
+    Repeated timestamps are rejected (first reading kept) unless
+    keep_duplicates, in which case they are only counted and left for
+    Building.normalize to resolve.
+
+    Raises ValueError when the Timestamp or Energy_kwh column is missing.
+    """
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    df = pd.read_csv(io.BytesIO(raw), on_bad_lines='skip', low_memory=False)
+    if TIMESTAMP_COL not in df.columns or KWH_COL not in df.columns:
+        raise ValueError(f"Missing '{TIMESTAMP_COL}' or '{KWH_COL}' column.")
+
+    # pandas skips lines with too many fields without saying so; compare
+    # the row count with the line count and find them only if they differ
+    lines = raw.count(b'\n') + (not raw.endswith(b'\n') and len(raw) > 0)
+    blank = raw.count(b'\n\n') + raw.count(b'\n\r\n')
+    line_numbers, malformed = None, []
+    if len(df) != lines - 1 - blank:
+        line_numbers, malformed = _malformed_lines(raw, len(df))
+
+    raw_timestamps = df[TIMESTAMP_COL]
+    raw_kwh = df[KWH_COL]
+    timestamps = _parse_timestamps(raw_timestamps)
+    kwh = raw_kwh if raw_kwh.dtype.kind == 'f' else pd.to_numeric(raw_kwh, errors='coerce')
+    t = timestamps.to_numpy()
+    k = kwh.to_numpy(dtype=np.float64)
+
+    # 0 = ok, otherwise 1 + index into REASONS; the first reason found wins
+    reason = np.zeros(len(df), dtype=np.int8)
+    reason[np.isnat(t)] = 1
+    reason[(reason == 0) & np.isnan(k)] = 2
+    reason[(reason == 0) & (k < 0)] = 3
+    valid = reason == 0
+    if valid.any():
+        median = np.median(k[valid])
+        spread = 1.4826 * np.median(np.abs(k[valid] - median))
+        if spread > 0:
+            reason[valid & (k > median + outlier_mads * spread)] = 4
+    valid = reason == 0
+    t_valid = t[valid]
+    if len(t_valid) > 1 and (t_valid[1:] >= t_valid[:-1]).all():
+        # already in time order (the usual case): repeats are neighbours
+        repeated = np.concatenate(([False], t_valid[1:] == t_valid[:-1]))
+    else:
+        repeated = pd.Series(t_valid).duplicated(keep='first').to_numpy()
+    repeated_count = int(repeated.sum())
+    if not keep_duplicates:
+        reason[np.flatnonzero(valid)[repeated]] = 5
+
+    ok = reason == 0
+    data = df if ok.all() else df[ok].copy()
+    data[TIMESTAMP_COL] = t[ok]
+    data[KWH_COL] = k[ok]
+
+    rejected_rows = np.flatnonzero(reason)
+    rejected = pd.DataFrame(columns=QUARANTINE_COLUMNS)
+    if len(rejected_rows):
+        if line_numbers is not None:
+            line = np.asarray(line_numbers)[rejected_rows]
+        else:
+            line = rejected_rows + 2     # header is line 1
+        rejected = pd.DataFrame({
+            'File': filepath.name,
+            'Line': line,
+            'Reason': np.array(REASONS)[reason[rejected_rows] - 1],
+            TIMESTAMP_COL: raw_timestamps.to_numpy()[rejected_rows],
+            KWH_COL: raw_kwh.to_numpy()[rejected_rows],
+        }, columns=QUARANTINE_COLUMNS)
+    if malformed:
+        rejected = pd.concat([rejected, pd.DataFrame({
+            'File': filepath.name,
+            'Line': [number for number, _ in malformed],
+            'Reason': MALFORMED,
+            TIMESTAMP_COL: [text for _, text in malformed],
+            KWH_COL: None,
+        })], ignore_index=True).sort_values('Line', kind='stable')
+
+    counts = dict(zip(REASONS, np.bincount(reason, minlength=len(REASONS) + 1)[1:].tolist()))
+    counts[MALFORMED] = len(malformed)
+    return ParsedFile(filepath.stem, data, rejected, counts,
+                      repeated_count if keep_duplicates else 0)
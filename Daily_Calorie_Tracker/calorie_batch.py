@@ -0,0 +1,198 @@
+#Batch calorie analysis for many users
+
+import os
+import json
+import time
+import argparse
+from itertools import islice
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from calorie_log import DAILY_LIMIT
+
+# Meal logs are CSV or JSON Lines with user, date, calories (and meal) columns.
+# They are read in chunks and split by user into shards of a columnar store
+# (one .npz of column arrays per shard and chunk, listed in catalog.json),
+# then every shard is analysed in its own process. A store whose catalog
+# matches the logs (same files, sizes and modification times) is reused.
+
+CHUNK_SIZE = 200000
+COLUMNS = ["user", "date", "calories"]
+CATALOG = "catalog.json"
+
+
+def read_chunks(path, chunk_size=CHUNK_SIZE):
+    # user ids stay text ("007" is not 7), and a chunk with a missing user
+    # must not turn the other ids of that chunk into floats ("7.0")
+    path = Path(path)
+    if path.suffix == ".csv":
+        return pd.read_csv(path, usecols=lambda c: c in COLUMNS, dtype={"user": str},
+                           chunksize=chunk_size)
+    return _read_json_lines(path, chunk_size)
+
+
+def _read_json_lines(path, chunk_size):
+    # pd.read_json reads the ids of a chunk with a null in it as floats
+    # whatever dtype it is given, so the records keep their own types here
+    with open(path, encoding="utf-8") as file:
+        while True:
+            lines = list(islice(file, chunk_size))
+            if not lines:
+                return
+            chunk = pd.DataFrame([json.loads(line) for line in lines if line.strip()], dtype=object)
+            if "user" in chunk:
+                chunk["user"] = chunk["user"].map(str, na_action="ignore")
+            yield chunk
+
+
+def _sources(paths):
+    sources = []
+    for path in paths:
+        stat = os.stat(path)
+        sources.append({"path": str(Path(path).resolve()), "size": stat.st_size,
+                        "mtime_ns": stat.st_mtime_ns})
+    return sources
+
+
+def open_store(paths, store_dir, shards=8):
+    """The part files of every shard and the row count of an existing
+    store built from exactly these logs (see build_store), or None."""
+    store_dir = Path(store_dir)
+    try:
+        with open(store_dir / CATALOG) as file:
+            catalog = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if catalog.get("sources") != _sources(paths) or len(catalog.get("shards", [])) != shards:
+        return None
+    shard_parts = [[store_dir / name for name in parts] for parts in catalog["shards"]]
+    if not all(part.exists() for parts in shard_parts for part in parts):
+        return None
+    return shard_parts, catalog["rows"], catalog.get("skipped", 0)
+
+
+def build_store(paths, store_dir, shards=8, chunk_size=CHUNK_SIZE):
+    """Streams the meal logs into `shards` shards, split by user. Every
+    chunk is written out as one part file per shard as soon as it is read,
+    so memory only holds one chunk.
+
+    Returns the part file paths of every shard, the number of rows stored
+    and the number of rows skipped (no user, bad date or calories)."""
+    store_dir = Path(store_dir)
+    store_dir.mkdir(parents=True, exist_ok=True)
+    # the catalog goes last, a build that fails leaves no catalog to reuse
+    (store_dir / CATALOG).unlink(missing_ok=True)
+    for old in store_dir.glob("shard_*.npz"):
+        old.unlink()
+    shard_parts = [[] for _ in range(shards)]
+    rows = 0
+    skipped = 0
+    part = 0
+
+    for path in paths:
+        for chunk in read_chunks(path, chunk_size):
+            missing = set(COLUMNS) - set(chunk.columns)
+            if missing:
+                raise ValueError(f"{path} is missing column(s): {', '.join(sorted(missing))}")
+            users = chunk["user"].str.strip()
+            # days since 1970-01-01; rows without a user, date or calories are dropped
+            days = pd.to_datetime(chunk["date"], errors="coerce").to_numpy("datetime64[D]")
+            calories = pd.to_numeric(chunk["calories"], errors="coerce").to_numpy(np.float64)
+            valid = ((users.notna() & (users != "")).to_numpy()
+                     & ~np.isnat(days) & ~np.isnan(calories) & (calories >= 0))
+            skipped += int(len(valid) - valid.sum())
+            users = users[valid].to_numpy(dtype=np.str_)
+            days, calories = days[valid].astype(np.int32), calories[valid]
+            shard_of = pd.util.hash_array(users) % shards
+            for shard in range(shards):
+                selected = shard_of == shard
+                if not selected.any():
+                    continue
+                part_path = store_dir / f"shard_{shard:03d}_part_{part:05d}.npz"
+                np.savez(part_path, user=users[selected], day=days[selected],
+                         calories=calories[selected])
+                shard_parts[shard].append(part_path)
+            rows += len(users)
+            part += 1
+
+    catalog = {"sources": _sources(paths), "rows": rows, "skipped": skipped,
+               "shards": [[p.name for p in parts] for parts in shard_parts]}
+    temp_path = store_dir / (CATALOG + ".tmp")
+    with open(temp_path, "w") as file:
+        json.dump(catalog, file)
+    os.replace(temp_path, store_dir / CATALOG)
+    return shard_parts, rows, skipped
+
+
+def analyse_shard(part_paths, daily_limit=DAILY_LIMIT):
+    """Per-user summary of one shard (its part files): days logged, average
+    and latest daily calories, remaining budget on the latest day and
+    over-limit days."""
+    columns = {"user": [], "day": [], "calories": []}
+    for part_path in part_paths:
+        with np.load(part_path) as data:
+            for name, parts in columns.items():
+                parts.append(data[name])
+    if not part_paths:
+        return pd.DataFrame()
+    df = pd.DataFrame({name: np.concatenate(parts) for name, parts in columns.items()})
+
+    daily = (df.groupby(["user", "day"], sort=True)["calories"].sum()
+             .rename("total").reset_index())
+    daily["over_limit"] = daily["total"] > daily_limit
+    # rows are sorted by user then day, so the last row of a user is their latest day
+    summary = daily.groupby("user", sort=False).agg(
+        days_logged=("day", "size"),
+        average_daily=("total", "mean"),
+        latest_day=("day", "last"),
+        latest_total=("total", "last"),
+        over_limit_days=("over_limit", "sum"),
+    )
+    summary["latest_day"] = pd.to_datetime(summary["latest_day"], unit="D").dt.date
+    summary["remaining_latest"] = daily_limit - summary["latest_total"]
+    summary["over_limit_latest"] = summary["latest_total"] > daily_limit
+    return summary
+
+
+def analyse(paths, store_dir="calorie_store", output="calorie_summary.csv",
+            shards=8, workers=None, daily_limit=DAILY_LIMIT, rebuild=False):
+    start = time.perf_counter()
+    store = None if rebuild else open_store(paths, store_dir, shards)
+    reused = store is not None
+    shard_parts, rows, skipped = store if reused else build_store(paths, store_dir, shards)
+    loaded = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(analyse_shard, shard_parts, [daily_limit] * len(shard_parts))
+        results = [r for r in results if not r.empty]
+    summary = pd.concat(results) if results else pd.DataFrame()
+    summary.sort_index().to_csv(output)
+    done = time.perf_counter()
+
+    action = "Reused the store of" if reused else "Stored"
+    print(f"{action} {rows} meals in {len(shard_parts)} shards in {loaded - start:.2f} s")
+    if skipped:
+        print(f"Skipped {skipped} rows without a user, a valid date or calories")
+    print(f"Analysed {len(summary)} users in {done - loaded:.2f} s "
+          f"({len(summary) / (done - start):.0f} users/sec overall)")
+    print(f"User summary saved to {output}")
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calorie analysis over exported meal logs of many users")
+    parser.add_argument("logs", nargs="+", help="CSV or JSONL files with user, date, meal, calories")
+    parser.add_argument("--store", default="calorie_store", help="directory of the columnar store")
+    parser.add_argument("--output", default="calorie_summary.csv")
+    parser.add_argument("--shards", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--limit", type=float, default=DAILY_LIMIT, help="daily calorie limit")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="rebuild the store even if it matches the logs")
+    args = parser.parse_args()
+    analyse(args.logs, args.store, args.output, args.shards, args.workers, args.limit, args.rebuild)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#Persistent calorie log with running daily rollups
+
+import os
+from datetime import date
+
+DAILY_LIMIT = 1800
+
+
+class CalorieLog:
+    """Append-only log of meals (date,meal,calories lines) plus rollups.
+
+    Every entry updates a per-day index when it is added, so daily totals,
+    rolling averages, over-limit streaks and per-meal statistics are read
+    from the rollups instead of rescanning the history. Days are stored by
+    their offset from the first logged day; entries for the latest day
+    (the usual case) update the running sums in constant time.
+    """
+
+    def __init__(self, file_path="calorie_log.csv", daily_limit=DAILY_LIMIT):
+        self.file_path = file_path
+        self.daily_limit = daily_limit
+        self.first_day = None
+        self.totals = []        # calories of each day
+        self.meal_counts = []   # meals logged on each day
+        self.cum_totals = [0]   # cum_totals[i] = calories of days before day i
+        self.cum_logged = [0]   # cum_logged[i] = days with meals before day i
+        self.streaks = []       # over-limit days in a row ending on each day
+        self.longest_streak = 0
+        self.meals = {}         # meal -> [count, total, min, max]
+        self.skipped = 0        # unreadable lines found by load()
+        self.load()
+
+    def load(self):
+        """Reads the log back. Malformed lines are counted in self.skipped
+        and left out; a half written last line (crash during add) is cut
+        off so the next entry starts on a line of its own."""
+        if not os.path.exists(self.file_path):
+            return
+        complete = 0    # byte offset just past the last complete line
+        torn = False
+        with open(self.file_path, "rb") as file:
+            for line in file:
+                if not line.endswith(b"\n"):
+                    torn = True
+                    break
+                complete += len(line)
+                try:
+                    day, meal, calories = line.decode().rstrip("\r\n").rsplit(",", 2)
+                    entry = (date.fromisoformat(day), meal, float(calories))
+                except ValueError:
+                    self.skipped += 1
+                    continue
+                self._update(*entry)
+        if torn:
+            os.truncate(self.file_path, complete)
+
+    def add(self, meal, calories, day=None):
+        """Appends one meal to the log and updates the rollups."""
+        if calories < 0:
+            raise ValueError("Calories can't be negative")
+        day = day or date.today()
+        meal = meal.replace(",", " ").strip()
+        with open(self.file_path, "a") as file:
+            file.write(f"{day.isoformat()},{meal},{calories}\n")
+        self._update(day, meal, calories)
+
+    def _index(self, day):
+        """Offset of day in the rollup lists, growing them as needed."""
+        if self.first_day is None:
+            self.first_day = day
+        offset = (day - self.first_day).days
+        if offset < 0:
+            # an entry older than everything logged so far: shift the lists
+            self.first_day = day
+            self.totals[:0] = [0] * -offset
+            self.meal_counts[:0] = [0] * -offset
+            self.cum_totals[:0] = [0] * -offset
+            self.cum_logged[:0] = [0] * -offset
+            self.streaks[:0] = [0] * -offset
+            offset = 0
+        while len(self.totals) <= offset:
+            self.totals.append(0)
+            self.meal_counts.append(0)
+            self.cum_totals.append(self.cum_totals[-1])
+            self.cum_logged.append(self.cum_logged[-1])
+            self.streaks.append(0)
+        return offset
+
+    def _update(self, day, meal, calories):
+        i = self._index(day)
+        newly_logged = self.meal_counts[i] == 0
+        self.totals[i] += calories
+        self.meal_counts[i] += 1
+        for j in range(i + 1, len(self.cum_totals)):
+            self.cum_totals[j] += calories
+            if newly_logged:
+                self.cum_logged[j] += 1
+        self._recount_streaks(i)
+
+        stats = self.meals.setdefault(meal.lower(), [0, 0, calories, calories])
+        stats[0] += 1
+        stats[1] += calories
+        stats[2] = min(stats[2], calories)
+        stats[3] = max(stats[3], calories)
+
+    def _recount_streaks(self, start, full=False):
+        # only the days from `start` on can change, and unless the limit
+        # changed, only until a day's streak comes out the same as before
+        for i in range(start, len(self.totals)):
+            before = self.streaks[i - 1] if i else 0
+            streak = before + 1 if self.totals[i] > self.daily_limit else 0
+            if streak == self.streaks[i] and i > start and not full:
+                break
+            self.streaks[i] = streak
+            self.longest_streak = max(self.longest_streak, streak)
+
+    def set_limit(self, daily_limit):
+        self.daily_limit = daily_limit
+        self.streaks = [0] * len(self.totals)
+        self.longest_streak = 0
+        self._recount_streaks(0, full=True)
+
+    def _offset(self, day):
+        if self.first_day is None:
+            return None
+        return ((day or date.today()) - self.first_day).days
+
+    def daily_total(self, day=None):
+        i = self._offset(day)
+        if i is None or not 0 <= i < len(self.totals):
+            return 0
+        return self.totals[i]
+
+    def calories_left(self, day=None):
+        return self.daily_limit - self.daily_total(day)
+
+    def rolling_average(self, days=7, end=None):
+        """Average calories per logged day over the `days` days up to end."""
+        i = self._offset(end)
+        if i is None or i < 0:
+            return 0
+        stop = min(i, len(self.totals) - 1) + 1
+        start = max(i + 1 - days, 0)
+        if start >= stop:
+            return 0
+        logged = self.cum_logged[stop] - self.cum_logged[start]
+        if logged == 0:
+            return 0
+        return (self.cum_totals[stop] - self.cum_totals[start]) / logged
+
+    def over_limit_streak(self, end=None):
+        """Days in a row, up to end (today), with more than the limit."""
+        i = self._offset(end)
+        if i is None or not 0 <= i < len(self.streaks):
+            return 0
+        return self.streaks[i]
+
+    def meal_stats(self, meal):
+        stats = self.meals.get(meal.lower())
+        if stats is None:
+            return None
+        count, total, lowest, highest = stats
+        return {"count": count, "average": total / count, "min": lowest, "max": highest}
@@ -1,19 +1,31 @@
 #Calorie Tracker
+from calorie_log import CalorieLog, DAILY_LIMIT
 
 print("***Daily Calorie Tracker***")
 
 meals=[]
 calories_intake=[]
+log=CalorieLog(daily_limit=DAILY_LIMIT)
 
 z=int(input("Enter total number of meals you had today:"))
 
 for i in range(z):
     meal=input(f"Enter the name of the meal{i+1}:")
-    cal_str=input(f"Enter the colories intake for the meal {meal}:")
+    while True:
+        cal_str=input(f"Enter the colories intake for the meal {meal}:")
+        try:
+            cal_str=float(cal_str)
+        except ValueError:
+            print("Please enter the calories as a number.")
+            continue
+        if cal_str<0:
+            print("Calories can't be negative.")
+            continue
+        break
     print()
-    cal_str=float(cal_str)
     meals.append(meal)
     calories_intake.append(cal_str)
+    log.add(meal,cal_str)
 
 print("\n***** Daily Calorie Report *****")
 for i in range(len(meals)):
@@ -22,13 +34,20 @@ for i in range(len(meals)):
 Total_calories=sum(calories_intake)
 print("\nTotal calories intake for the day:",Total_calories)
 
-Calories_left=1800-Total_calories
+Calories_left=DAILY_LIMIT-Total_calories
 print("\nCalories left for the day:",Calories_left)
 
 Average_calories=Total_calories/z
 print("Average calories intake for the day:",Average_calories)
 
-if Total_calories>1800:
+if Total_calories>DAILY_LIMIT:
         print("Warning: You have exceeded your daily calorie limit!")
 else :
-        print("Good Job! you are within your daily calorie limit")
\ No newline at end of file
+        print("Good Job! you are within your daily calorie limit")
+
+print("\n***** History *****")
+print("Total calories logged today:",log.daily_total())
+print("7-day average calories:",round(log.rolling_average(7),2))
+print("30-day average calories:",round(log.rolling_average(30),2))
+print("Days in a row over the limit:",log.over_limit_streak())
+print("Longest over-limit streak:",log.longest_streak,"days")
@@ -0,0 +1,55 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from calorie_batch import analyse_shard, build_store
+
+
+class BuildStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.dir.name)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def summarize(self, log):
+        shard_parts, rows, skipped = build_store([log], self.root / "store", shards=4, chunk_size=2)
+        results = [analyse_shard(parts) for parts in shard_parts]
+        summary = pd.concat([r for r in results if not r.empty])
+        return summary, rows, skipped
+
+    def test_user_split_over_chunks_with_a_blank_user(self):
+        log = self.root / "meals.csv"
+        # chunks of two rows: the second one holds the blank user
+        log.write_text("user,date,calories\n"
+                       "007,2024-01-01,500\n"
+                       "007,2024-01-01,700\n"
+                       ",2024-01-01,300\n"
+                       "007,2024-01-02,900\n"
+                       "7,2024-01-02,100\n")
+        summary, rows, skipped = self.summarize(log)
+        self.assertEqual((rows, skipped), (4, 1))
+        self.assertEqual(sorted(summary.index), ["007", "7"])
+        self.assertEqual(summary.loc["007", "days_logged"], 2)
+        self.assertEqual(summary.loc["007", "latest_total"], 900)
+
+    def test_jsonl_ids_stay_text(self):
+        log = self.root / "meals.jsonl"
+        log.write_text('{"user": 7, "date": "2024-01-01", "calories": 500}\n'
+                       '{"user": 7, "date": "2024-01-02", "calories": 400}\n'
+                       '{"user": null, "date": "2024-01-02", "calories": 300}\n'
+                       '{"user": 7, "date": "2024-01-02", "calories": 200}\n')
+        summary, rows, skipped = self.summarize(log)
+        self.assertEqual((rows, skipped), (3, 1))
+        self.assertEqual(list(summary.index), ["7"])
+        self.assertEqual(summary.loc["7", "latest_total"], 600)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,11 +4,6 @@
 # Gradebook Analyzer
 # ------------------------------------------------------------
 
-#welcome message
-print("======================================")
-print("   Welcome to the Gradebook Analyzer   ")
-print("======================================\n")
-
 #functions and calculations
 def calculate_average(marks_dict):
     if not marks_dict:
@@ -33,20 +28,22 @@ def find_min_score(marks_dict):
         return 0
     return min(marks_dict.values())
 
-#assign graded using if-else
-def assign_grades(marks_dict):
+#grade cutoffs (highest first) and pass mark, see grading.py for other schemes
+GRADE_CUTOFFS = {"A": 90, "B": 80, "C": 70, "D": 60}
+PASS_MARK = 40
+
+#grade for a single score
+def grade_for(score, cutoffs=GRADE_CUTOFFS):
+    for grade, cutoff in cutoffs.items():
+        if score >= cutoff:
+            return grade
+    return "F"
+
+#assign grades to every student
+def assign_grades(marks_dict, cutoffs=GRADE_CUTOFFS):
     grades = {}
     for name, score in marks_dict.items():
-        if score >= 90:
-            grades[name] = "A"
-        elif score >= 80:
-            grades[name] = "B"
-        elif score >= 70:
-            grades[name] = "C"
-        elif score >= 60:
-            grades[name] = "D"
-        else:
-            grades[name] = "F"
+        grades[name] = grade_for(score, cutoffs)
     return grades
 
 def count_grade_distribution(grades_dict):
@@ -56,10 +53,10 @@ def count_grade_distribution(grades_dict):
     return distribution
 
 #check for pass and fail
-def pass_fail(marks_dict):
+def pass_fail(marks_dict, pass_mark=PASS_MARK):
     return (
-        [n for n, s in marks_dict.items() if s >= 40],
-        [n for n, s in marks_dict.items() if s < 40]  )
+        [n for n, s in marks_dict.items() if s >= pass_mark],
+        [n for n, s in marks_dict.items() if s < pass_mark]  )
 
 #table
 def results_table(marks_dict, grades_dict):
@@ -70,57 +67,80 @@ def results_table(marks_dict, grades_dict):
     print("-------------------------------------")
 
 #input marks and assign grade using loop
-while True:
-    print("\nMenu:")
-    print("1. Enter Student Data Manually")
-    print("2. Exit")
+def main():
+    #welcome message
+    print("======================================")
+    print("   Welcome to the Gradebook Analyzer   ")
+    print("======================================\n")
+
+    while True:
+        print("\nMenu:")
+        print("1. Enter Student Data Manually")
+        print("2. Load Marks From File (batch mode)")
+        print("3. Exit")
 
-    choice = input("\nEnter your choice (1 or 2): ")
+        choice = input("\nEnter your choice (1, 2 or 3): ")
 
-    if choice == "1":
-        marks = {}
-        num_students = int(input("\nEnter number of students: "))
+        if choice == "1":
+            marks = {}
+            num_students = int(input("\nEnter number of students: "))
 
-        for i in range(num_students):
-            name = input(f"Enter name of student {i+1}: ")
-            mark = float(input(f"Enter marks for {name}: "))
-            marks[name] = mark
+            for i in range(num_students):
+                name = input(f"Enter name of student {i+1}: ")
+                mark = float(input(f"Enter marks for {name}: "))
+                marks[name] = mark
 
 
-        avg = calculate_average(marks)
-        median = calculate_median(marks)
-        high = find_max_score(marks)
-        low = find_min_score(marks)
+            avg = calculate_average(marks)
+            median = calculate_median(marks)
+            high = find_max_score(marks)
+            low = find_min_score(marks)
 
-        print("\n--- Summary ---")
-        print(f"Average Marks: {avg:.2f}")
-        print(f"Median Marks: {median:.2f}")
-        print(f"Highest Marks: {high}")
-        print(f"Lowest Marks: {low}")
+            print("\n--- Summary ---")
+            print(f"Average Marks: {avg:.2f}")
+            print(f"Median Marks: {median:.2f}")
+            print(f"Highest Marks: {high}")
+            print(f"Lowest Marks: {low}")
 
 
-        grades = assign_grades(marks)
-        distribution = count_grade_distribution(grades)
+            grades = assign_grades(marks)
+            distribution = count_grade_distribution(grades)
 
-        print("\n--- Grade Distribution ---")
-        for grade, count in distribution.items():
-            print(f"{grade}: {count}")
+            print("\n--- Grade Distribution ---")
+            for grade, count in distribution.items():
+                print(f"{grade}: {count}")
 
 
-        passed, failed = pass_fail(marks)
+            passed, failed = pass_fail(marks)
 
-        print("\n--- Pass/Fail Summary ---")
-        print(f"Passed: {', '.join(passed) if passed else 'None'}")
-        print(f"Failed: {', '.join(failed) if failed else 'None'}")
+            print("\n--- Pass/Fail Summary ---")
+            print(f"Passed: {', '.join(passed) if passed else 'None'}")
+            print(f"Failed: {', '.join(failed) if failed else 'None'}")
 
 
 
-        print("\n--- Final Results ---")
-        results_table(marks, grades)
+            print("\n--- Final Results ---")
+            results_table(marks, grades)
+
+        elif choice == "2":
+            #numpy/pandas are only needed for batch mode
+            from gradebook_batch import grade_file
+            path = input("\nEnter path of the marks file (CSV or Parquet): ")
+            try:
+                summary = grade_file(path)
+            except (OSError, ValueError) as e:
+                print(f"\nCould not grade {path}: {e}")
+                continue
+            print("\n--- Course Summary ---")
+            print(summary.to_string(float_format="%.2f"))
+
+        elif choice == "3":
+            print("\nExiting the Gradebook Analyzer. Goodbye!")
+            break
+
+        else:
+            print("\nInvalid choice. Please try again.")
 
-    elif choice == "2":
-        print("\nExiting the Gradebook Analyzer. Goodbye!")
-        break
 
-    else:
-        print("\nInvalid choice. Please try again.")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# ------------------------------------------------------------
+# Gradebook Analyzer - batch mode
+# Grades whole cohorts from a CSV / Parquet file with NumPy
+# ------------------------------------------------------------
+
+import argparse
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from grading import GRADE_LETTERS, Regrader, SchemeBook
+
+DEFAULT_COURSE = "ALL"
+# keeps the grades of cohorts already graded under a scheme
+REGRADER = Regrader()
+
+
+#load marks into numpy arrays
+def load_marks(path):
+    """Reads a marks file with `name` and `marks` columns (plus an optional
+    `course` column) and returns (course_names, course_codes, names, marks).
+
+    Raises ValueError when a column is missing or no row has numeric marks."""
+    path = Path(path)
+    if path.suffix == ".parquet":
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path)
+
+    missing = {"name", "marks"} - set(df.columns)
+    if missing:
+        raise ValueError(f"{path.name} is missing column(s): {', '.join(sorted(missing))}")
+    if "course" not in df.columns:
+        df["course"] = DEFAULT_COURSE
+
+    marks = pd.to_numeric(df["marks"], errors="coerce").to_numpy(dtype=np.float64)
+    # "nan" / "inf" parse as numbers but are not marks
+    valid = np.isfinite(marks)
+    if not valid.any():
+        raise ValueError(f"{path.name} has no rows with numeric marks")
+    codes, course_names = pd.factorize(df["course"].to_numpy()[valid], sort=True)
+    names = df["name"].to_numpy()[valid]
+    return np.asarray(course_names), codes, names, marks[valid]
+
+
+#all course summaries from the one sort of the cohort the grading made
+def summarize_courses(course_names, course_codes, marks, grade_index=None, passed=None, cohort=None):
+    """Average, median, highest, lowest, grade distribution and pass/fail
+    counts of every course, as a DataFrame indexed by course.
+
+    grade_index / passed come from Regrader.regrade and cohort (the
+    SortedCohort) from Regrader.cohort; the default scheme and REGRADER's
+    cached cohort are used when they are not given."""
+    cohort_key = None
+    if cohort is None:
+        cohort_key, cohort = REGRADER.cohort(course_names, course_codes, marks)
+    if grade_index is None or passed is None:
+        grade_index, passed = REGRADER.regrade(course_names, course_codes, marks, cohort_id=cohort_key)
+    n_courses = len(course_names)
+    sorted_marks = cohort.sorted_marks
+    counts = cohort.counts
+    starts = cohort.starts
+    ends = starts + counts - 1
+    # every course from load_marks has at least one student
+    totals = np.add.reduceat(sorted_marks, starts)
+    medians = (sorted_marks[starts + (counts - 1) // 2] + sorted_marks[starts + counts // 2]) / 2
+
+    distribution = np.bincount(
+        course_codes * len(GRADE_LETTERS) + grade_index,
+        minlength=n_courses * len(GRADE_LETTERS),
+    ).reshape(n_courses, len(GRADE_LETTERS))
+    passed = np.bincount(course_codes, weights=passed, minlength=n_courses)
+
+    summary = pd.DataFrame({
+        "Students": counts,
+        "Average": totals / counts,
+        "Median": medians,
+        "Highest": sorted_marks[ends],
+        "Lowest": sorted_marks[starts],
+    }, index=pd.Index(course_names, name="Course"))
+    # A..F in the same order as count_grade_distribution
+    for column, letter in reversed(list(enumerate(GRADE_LETTERS))):
+        summary[str(letter)] = distribution[:, column]
+    summary["Passed"] = passed.astype(np.int64)
+    summary["Failed"] = counts - summary["Passed"]
+    return summary
+
+
+def grade_file(path, grades_out=None, schemes=None):
+    course_names, course_codes, names, marks = load_marks(path)
+    cohort_key, cohort = REGRADER.cohort(course_names, course_codes, marks)
+    grade_index, passed = REGRADER.regrade(course_names, course_codes, marks, schemes, cohort_key)
+    summary = summarize_courses(course_names, course_codes, marks, grade_index, passed, cohort)
+    if grades_out:
+        pd.DataFrame({
+            "course": course_names[course_codes],
+            "name": names,
+            "marks": marks,
+            "grade": GRADE_LETTERS[grade_index],
+            "result": np.where(passed, "Pass", "Fail"),
+        }).to_csv(grades_out, index=False)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Grade whole cohorts from a marks file")
+    parser.add_argument("marks_file", help="CSV or Parquet file with course, name, marks")
+    parser.add_argument("--grades-out", help="write every student's grade to this CSV")
+    parser.add_argument("--schemes", help="JSON grading scheme config (see grading.py)")
+    args = parser.parse_args()
+
+    schemes = SchemeBook.load(args.schemes) if args.schemes else None
+    summary = grade_file(args.marks_file, args.grades_out, schemes)
+    print("\n--- Course Summary ---")
+    print(summary.to_string(float_format="%.2f"))
+    if args.grades_out:
+        print(f"\nStudent grades saved to {args.grades_out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# ------------------------------------------------------------
+# Gradebook Analyzer - streaming statistics
+# One pass, constant memory, mergeable across workers
+# ------------------------------------------------------------
+
+import sys
+import math
+import argparse
+from gradebook import grade_for, PASS_MARK
+
+
+class GradeAccumulator:
+    """Running statistics over a stream of marks.
+
+    Mean and variance use Welford's method, the median and percentiles
+    come from a fixed bucket histogram over [low, high] (exact when marks
+    are recorded with `resolution` precision, e.g. 72.5). Two accumulators
+    with the same buckets can be merged, so every worker keeps its own and
+    the results are combined at the end. A mark that is missing (None) or
+    not a finite number is only counted in `invalid`.
+    """
+
+    def __init__(self, low=0, high=100, resolution=0.1):
+        self.low = low
+        self.high = high
+        self.resolution = resolution
+        self.count = 0
+        self.invalid = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.passed = 0
+        self.distribution = {"A": 0, "B": 0, "C": 0, "D": 0, "F": 0}
+        self.buckets = [0] * (round((high - low) / resolution) + 1)
+
+    def _bucket(self, score):
+        # marks outside [low, high] land in the first / last bucket
+        index = round((score - self.low) / self.resolution)
+        return min(max(index, 0), len(self.buckets) - 1)
+
+    def add(self, score):
+        if score is None or not math.isfinite(score):
+            self.invalid += 1
+            return
+        self.count += 1
+        delta = score - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (score - self.mean)
+        self.min = min(self.min, score)
+        self.max = max(self.max, score)
+        if score >= PASS_MARK:
+            self.passed += 1
+        self.distribution[grade_for(score)] += 1
+        self.buckets[self._bucket(score)] += 1
+
+    def add_many(self, scores):
+        for score in scores:
+            self.add(score)
+
+    def merge(self, other):
+        """Adds the statistics of another accumulator to this one."""
+        if (other.low, other.high, other.resolution) != (self.low, self.high, self.resolution):
+            raise ValueError("Cannot merge accumulators with different buckets")
+        self.invalid += other.invalid
+        if other.count == 0:
+            return self
+        # Chan et al. pairwise update of the mean and sum of squares
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.passed += other.passed
+        for grade, number in other.distribution.items():
+            self.distribution[grade] += number
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        return self
+
+    @property
+    def failed(self):
+        return self.count - self.passed
+
+    def variance(self):
+        return self.m2 / self.count if self.count else 0
+
+    def std(self):
+        return math.sqrt(self.variance())
+
+    def _value_at(self, rank):
+        """Mark of the rank-th smallest score (0 based)."""
+        seen = 0
+        for index, number in enumerate(self.buckets):
+            seen += number
+            if seen > rank:
+                value = round(self.low + index * self.resolution, 9)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def percentile(self, q):
+        """q-th percentile (0-100), interpolated like calculate_median."""
+        if self.count == 0:
+            return 0
+        rank = q / 100 * (self.count - 1)
+        lower = self._value_at(math.floor(rank))
+        upper = self._value_at(math.ceil(rank))
+        return lower + (upper - lower) * (rank - math.floor(rank))
+
+    def median(self):
+        return self.percentile(50)
+
+    def summary(self):
+        return {
+            "Students": self.count,
+            "Average": self.mean if self.count else 0,
+            "Median": self.median(),
+            "Std Dev": self.std(),
+            "Highest": self.max if self.count else 0,
+            "Lowest": self.min if self.count else 0,
+            "Passed": self.passed,
+            "Failed": self.failed,
+            "Invalid": self.invalid,
+        }
+
+
+def read_marks(lines):
+    """Yields the marks of `name,marks` lines, None for a line without a
+    finite mark ("abc", "nan", "inf"), which GradeAccumulator counts as invalid."""
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            mark = float(line.rsplit(",", 1)[-1])
+        except ValueError:
+            yield None
+            continue
+        yield mark if math.isfinite(mark) else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="One-pass statistics over a stream of marks")
+    parser.add_argument("marks_file", nargs="?", help="`name,marks` lines, stdin if omitted")
+    args = parser.parse_args()
+
+    accumulator = GradeAccumulator()
+    if args.marks_file:
+        with open(args.marks_file) as file:
+            accumulator.add_many(read_marks(file))
+    else:
+        accumulator.add_many(read_marks(sys.stdin))
+
+    print("\n--- Summary ---")
+    for key, value in accumulator.summary().items():
+        print(f"{key}: {value:.2f}" if isinstance(value, float) else f"{key}: {value}")
+    print("\n--- Grade Distribution ---")
+    for grade, count in accumulator.distribution.items():
+        print(f"{grade}: {count}")
+    for q in (25, 75, 90):
+        print(f"{q}th percentile: {accumulator.percentile(q):.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+# ------------------------------------------------------------
+# Gradebook Analyzer - grading schemes
+# Absolute, z-score and percentile grading, per course,
+# re-graded over a whole cohort with NumPy
+# ------------------------------------------------------------
+
+import json
+import time
+import hashlib
+import argparse
+from collections import OrderedDict
+import numpy as np
+from gradebook import GRADE_CUTOFFS, PASS_MARK
+
+LETTERS = ["A", "B", "C", "D"]      # anything below the D cutoff is an F
+GRADE_LETTERS = np.array(["F", "D", "C", "B", "A"])
+
+DEFAULT_CUTOFFS = {
+    # marks
+    "absolute": GRADE_CUTOFFS,
+    # standard deviations above / below the course mean
+    "zscore": {"A": 1.5, "B": 0.5, "C": -0.5, "D": -1.5},
+    # percentile of the course, e.g. the top 10% get an A
+    "percentile": {"A": 90, "B": 70, "C": 40, "D": 15},
+}
+
+
+class GradingScheme:
+    def __init__(self, kind="absolute", cutoffs=None, pass_mark=PASS_MARK):
+        if kind not in DEFAULT_CUTOFFS:
+            raise ValueError(f"Unknown grading scheme {kind!r}, expected one of {', '.join(DEFAULT_CUTOFFS)}")
+        cutoffs = cutoffs or DEFAULT_CUTOFFS[kind]
+        # a partial set of cutoffs is an error, not a silent mix with the defaults
+        missing = [letter for letter in LETTERS if letter not in cutoffs]
+        unknown = sorted(set(cutoffs) - set(LETTERS))
+        if missing or unknown:
+            problems = [f"missing {', '.join(missing)}"] if missing else []
+            problems += [f"unknown {', '.join(unknown)}"] if unknown else []
+            raise ValueError(f"{kind.capitalize()} cutoffs need exactly the grades "
+                             f"{', '.join(LETTERS)} ({'; '.join(problems)}), got {cutoffs}")
+        values = [cutoffs[letter] for letter in LETTERS]
+        if values != sorted(values, reverse=True):
+            raise ValueError(f"Cutoffs must go down from A to D, got {cutoffs}")
+        self.kind = kind
+        self.cutoffs = dict(zip(LETTERS, values))
+        self.pass_mark = pass_mark
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(config.get("type", "absolute"), config.get("cutoffs"),
+                   config.get("pass_mark", PASS_MARK))
+
+    def key(self):
+        return (self.kind, tuple(self.cutoffs.values()), self.pass_mark)
+
+    def __repr__(self):
+        return f"GradingScheme({self.kind!r}, {self.cutoffs}, pass_mark={self.pass_mark})"
+
+
+class SchemeBook:
+    """The default scheme plus any per-course overrides.
+
+    Config file layout:
+        {"default": {"type": "absolute", "cutoffs": {"A": 90, ...}, "pass_mark": 40},
+         "courses": {"CS101": {"type": "zscore"}, "MA102": {"type": "percentile"}}}
+    """
+
+    def __init__(self, default=None, courses=None):
+        self.default = default or GradingScheme()
+        self.courses = courses or {}
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as file:
+            config = json.load(file)
+        default = GradingScheme.from_config(config.get("default", {}))
+        courses = {course: GradingScheme.from_config(c)
+                   for course, c in config.get("courses", {}).items()}
+        return cls(default, courses)
+
+    def for_course(self, course):
+        return self.courses.get(course, self.default)
+
+    def key(self):
+        return (self.default.key(), tuple(sorted((c, s.key()) for c, s in self.courses.items())))
+
+
+class SortedCohort:
+    """A cohort sorted by course then marks, the work every scheme shares."""
+
+    def __init__(self, course_names, course_codes, marks):
+        self.course_names = course_names
+        self.course_codes = course_codes
+        self.marks = marks
+        order = np.lexsort((marks, course_codes))
+        self.sorted_marks = marks[order]
+        self.counts = np.bincount(course_codes, minlength=len(course_names))
+        self.starts = np.concatenate(([0], np.cumsum(self.counts)[:-1]))
+        self.means = np.bincount(course_codes, weights=marks, minlength=len(course_names)) / self.counts
+        squares = np.bincount(course_codes, weights=marks * marks, minlength=len(course_names))
+        self.stds = np.sqrt(np.maximum(squares / self.counts - self.means ** 2, 0))
+
+    def percentiles(self, courses, q):
+        """Percentiles q (one row per course in `courses`) of those courses,
+        interpolated linearly like np.percentile."""
+        rank = q / 100 * (self.counts[courses, None] - 1)
+        lower = np.floor(rank).astype(np.int64)
+        upper = np.ceil(rank).astype(np.int64)
+        starts = self.starts[courses, None]
+        low = self.sorted_marks[starts + lower]
+        high = self.sorted_marks[starts + upper]
+        return low + (high - low) * (rank - lower)
+
+
+def fingerprint(course_names, course_codes, marks):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps([str(c) for c in course_names]).encode())
+    digest.update(np.ascontiguousarray(course_codes).tobytes())
+    digest.update(np.ascontiguousarray(marks).tobytes())
+    return digest.hexdigest()
+
+
+class Regrader:
+    """Grades cohorts under a SchemeBook, caching the result per
+    (cohort, schemes) so the same request is only computed once.
+
+    Only the most recently used max_cohorts sorted cohorts and max_results
+    results are kept, so a long session doesn't hold every file it graded.
+    """
+
+    def __init__(self, max_cohorts=4, max_results=16):
+        self.max_cohorts = max_cohorts
+        self.max_results = max_results
+        self.cohorts = OrderedDict()
+        self.results = OrderedDict()
+
+    @staticmethod
+    def _cached(cache, key, limit, compute):
+        if key in cache:
+            cache.move_to_end(key)
+        else:
+            cache[key] = compute()
+            if len(cache) > limit:
+                cache.popitem(last=False)
+        return cache[key]
+
+    def cohort(self, course_names, course_codes, marks, cohort_id=None):
+        # a stored cohort can pass its own id and skip hashing the marks
+        key = cohort_id or fingerprint(course_names, course_codes, marks)
+        cohort = self._cached(self.cohorts, key, self.max_cohorts,
+                              lambda: SortedCohort(course_names, course_codes, marks))
+        return key, cohort
+
+    def regrade(self, course_names, course_codes, marks, schemes=None, cohort_id=None):
+        """Returns (grade_index, passed) arrays, one entry per student.
+
+        grade_index is 0 for F up to 4 for A (see GRADE_LETTERS)."""
+        schemes = schemes or SchemeBook()
+        cohort_key, cohort = self.cohort(course_names, course_codes, marks, cohort_id)
+        key = (cohort_key, schemes.key())
+        return self._cached(self.results, key, self.max_results,
+                            lambda: grade_cohort(cohort, schemes))
+
+
+def grade_cohort(cohort, schemes):
+    n_courses = len(cohort.course_names)
+    # one row of D, C, B, A cutoffs (in marks) per course
+    cutoffs = np.empty((n_courses, len(LETTERS)))
+    pass_marks = np.empty(n_courses)
+    kinds = {}
+    for course, name in enumerate(cohort.course_names):
+        scheme = schemes.for_course(name)
+        cutoffs[course] = list(reversed(scheme.cutoffs.values()))
+        pass_marks[course] = scheme.pass_mark
+        kinds.setdefault(scheme.kind, []).append(course)
+
+    for kind, courses in kinds.items():
+        courses = np.array(courses)
+        if kind == "zscore":
+            cutoffs[courses] = (cohort.means[courses, None]
+                                + cutoffs[courses] * cohort.stds[courses, None])
+        elif kind == "percentile":
+            cutoffs[courses] = cohort.percentiles(courses, cutoffs[courses])
+
+    codes = cohort.course_codes
+    grade_index = (cohort.marks[:, None] >= cutoffs[codes]).sum(axis=1)
+    passed = cohort.marks >= pass_marks[codes]
+    return grade_index, passed
+
+
+def main():
+    # imported here so grading.py itself doesn't need pandas
+    from gradebook_batch import load_marks, summarize_courses
+
+    parser = argparse.ArgumentParser(description="Re-grade a stored cohort under a grading scheme config")
+    parser.add_argument("marks_file", help="CSV or Parquet file with course, name, marks")
+    parser.add_argument("schemes", help="JSON grading scheme config")
+    args = parser.parse_args()
+
+    course_names, course_codes, names, marks = load_marks(args.marks_file)
+    schemes = SchemeBook.load(args.schemes)
+    regrader = Regrader()
+    start = time.perf_counter()
+    cohort_key, cohort = regrader.cohort(course_names, course_codes, marks)
+    grade_index, passed = regrader.regrade(course_names, course_codes, marks, schemes, cohort_key)
+    elapsed = time.perf_counter() - start
+
+    print("\n--- Course Summary ---")
+    print(summarize_courses(course_names, course_codes, marks, grade_index, passed, cohort)
+          .to_string(float_format="%.2f"))
+    print(f"\nRe-graded {len(marks)} students in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
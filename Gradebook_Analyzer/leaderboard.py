@@ -0,0 +1,108 @@
+# ------------------------------------------------------------
+# Gradebook Analyzer - leaderboard
+# Rank, top-k and range queries that stay sorted as marks change
+# ------------------------------------------------------------
+
+import argparse
+from bisect import bisect_left, bisect_right
+from gradebook import grade_for
+
+
+class Leaderboard:
+    """Students ordered by marks (highest first, then by name).
+
+    Two parallel sorted lists are kept: (-marks, name) for the order and
+    -marks alone for bisecting on a score. Adding or updating a student
+    finds its place with a binary search, so rank, top-k and range
+    queries never need a full sort.
+    """
+
+    def __init__(self, marks_dict=None):
+        self.marks = dict(marks_dict or {})
+        # a whole cohort is sorted once, later changes are inserted in place
+        self.order = sorted((-score, name) for name, score in self.marks.items())
+        self.keys = [score for score, name in self.order]
+
+    def __len__(self):
+        return len(self.order)
+
+    def __contains__(self, name):
+        return name in self.marks
+
+    def set(self, name, score):
+        """Adds a student or updates their marks."""
+        if name in self.marks:
+            self.remove(name)
+        self.marks[name] = score
+        position = bisect_left(self.order, (-score, name))
+        self.order.insert(position, (-score, name))
+        self.keys.insert(position, -score)
+
+    def remove(self, name):
+        score = self.marks.pop(name)
+        position = bisect_left(self.order, (-score, name))
+        del self.order[position]
+        del self.keys[position]
+
+    def rank(self, name):
+        """1 for the top student; students with equal marks share a rank."""
+        return bisect_left(self.keys, -self.marks[name]) + 1
+
+    def top(self, k):
+        return [(name, -score) for score, name in self.order[:k]]
+
+    def between(self, low, high):
+        """Students with low <= marks <= high, highest first."""
+        start = bisect_left(self.keys, -high)
+        end = bisect_right(self.keys, -low)
+        return [(name, -score) for score, name in self.order[start:end]]
+
+    def page(self, number, page_size=20):
+        """Rows (rank, name, marks) of the 1-based page `number`."""
+        start = (number - 1) * page_size
+        rows = []
+        for score, name in self.order[start:start + page_size]:
+            rows.append((bisect_left(self.keys, score) + 1, name, -score))
+        return rows
+
+    def pages(self, page_size=20):
+        return max(1, -(-len(self.order) // page_size))
+
+    def render_page(self, number, page_size=20, grades_dict=None):
+        """Prints one page of the results table, in rank order."""
+        print(f"\nRank\tName\t\tMarks\tGrade\t(page {number} of {self.pages(page_size)})")
+        print("-------------------------------------")
+        for rank, name, score in self.page(number, page_size):
+            grade = grades_dict[name] if grades_dict else grade_for(score)
+            print(f"{rank:<4}\t{name:<10}\t{score:<6}\t{grade}")
+        print("-------------------------------------")
+
+
+def main():
+    # pandas / numpy only for reading the file
+    from gradebook_batch import load_marks
+
+    parser = argparse.ArgumentParser(description="Ranked results for one course")
+    parser.add_argument("marks_file", help="CSV or Parquet file with course, name, marks")
+    parser.add_argument("--course", help="course to rank (default: the first one)")
+    parser.add_argument("--page", type=int, default=1)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--student", help="also print this student's rank")
+    args = parser.parse_args()
+
+    course_names, course_codes, names, marks = load_marks(args.marks_file)
+    course = args.course or course_names[0]
+    selected = course_names[course_codes] == course
+    board = Leaderboard(dict(zip(names[selected].tolist(), marks[selected].tolist())))
+
+    print(f"\n--- Results for {course} ---")
+    board.render_page(args.page, args.page_size)
+    if args.student:
+        if args.student in board:
+            print(f"{args.student} is ranked {board.rank(args.student)} of {len(board)}")
+        else:
+            print(f"{args.student} is not in {course}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,18 @@
+import sys
+
+# the only two states a book can be in, shared by every Book
+AVAILABLE = sys.intern("available")
+ISSUED = sys.intern("issued")
+
 class Book:
-    def __init__(self,title,author,isbn,status="available"):
+    # no per-object __dict__, a catalogue holds millions of these
+    __slots__ = ("title", "author", "isbn", "status")
+
+    def __init__(self,title,author,isbn,status=AVAILABLE):
         self.title = title
-        self.author = author
+        self.author = sys.intern(author)
         self.isbn = isbn
-        self.status = status
+        self.status = sys.intern(status)
 
     def __str__(self):
         return f"'{self.title}' by {self.author} (ISBN: {self.isbn}) - Status: {self.status}"
@@ -16,19 +25,19 @@ class Book:
         return Book(title, author, isbn, status)
     
     def issue(self):
-        if self.status == "available":
-            self.status = "issued"
+        if self.status == AVAILABLE:
+            self.status = ISSUED
             return True
         return False
     
     def return_book(self):
-        if self.status == "issued":
-            self.status = "available"
+        if self.status == ISSUED:
+            self.status = AVAILABLE
             return True
         return False
     
     def is_available(self):
-        return self.status == "available"
+        return self.status == AVAILABLE
     
     class Library_inventory:
         def __init__(self):
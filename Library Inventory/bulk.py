@@ -0,0 +1,163 @@
+import csv
+import json
+import time
+import logging
+import argparse
+from itertools import islice
+from pathlib import Path
+import numpy as np
+from book import Book
+from inventory import LibraryInventory
+
+# Bulk import / export of the catalogue as CSV or JSON Lines
+# (title, author, isbn and an optional status column / key).
+
+BATCH_SIZE = 10000
+FIELDS = ["title", "author", "isbn", "status"]
+ISBN13_WEIGHTS = np.array([1, 3] * 6 + [1])
+ISBN10_WEIGHTS = np.arange(10, 0, -1)
+
+
+def clean_isbn(isbn):
+    return isbn.replace("-", "").replace(" ", "").upper()
+
+
+def _digits(isbns, length):
+    """(n, length) array of digit values, 'X' counts as 10."""
+    raw = np.frombuffer("".join(isbns).encode("ascii", "replace"), dtype=np.uint8)
+    digits = raw.reshape(-1, length).astype(np.int64) - ord("0")
+    digits[raw.reshape(-1, length) == ord("X")] = 10
+    return digits
+
+
+def valid_isbns(isbns):
+    """Boolean array telling which of the (cleaned) ISBNs have a valid checksum."""
+    valid = np.zeros(len(isbns), dtype=bool)
+    lengths = np.array([len(i) for i in isbns])
+
+    rows = np.flatnonzero(lengths == 13)
+    if len(rows):
+        digits = _digits([isbns[r] for r in rows], 13)
+        ok = ((digits >= 0) & (digits <= 9)).all(axis=1)
+        valid[rows] = ok & (digits @ ISBN13_WEIGHTS % 10 == 0)
+
+    rows = np.flatnonzero(lengths == 10)
+    if len(rows):
+        digits = _digits([isbns[r] for r in rows], 10)
+        # only the check digit may be an X
+        ok = ((digits[:, :9] >= 0) & (digits[:, :9] <= 9)).all(axis=1)
+        ok &= (digits[:, 9] >= 0) & (digits[:, 9] <= 10)
+        valid[rows] = ok & (digits @ ISBN10_WEIGHTS % 11 == 0)
+    return valid
+
+
+def read_records(path):
+    """Streams dicts from a .csv or .jsonl file. A JSON line that doesn't
+    hold an object comes out as an empty record, which is counted invalid."""
+    path = Path(path)
+    with open(path, 'r', newline='', encoding='utf-8') as file:
+        if path.suffix == ".csv":
+            yield from csv.DictReader(file)
+        else:
+            for number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    record = None
+                    logging.info(f"Bad JSON on line {number} of {path.name}: {e}")
+                yield record if isinstance(record, dict) else {}
+
+
+def _text(record, key):
+    value = record.get(key)
+    return "" if value is None else str(value)
+
+
+def import_catalogue(inventory, path, batch_size=BATCH_SIZE):
+    """Validates the records of path batch by batch and adds them in one write.
+
+    Returns a dict with the added / invalid / duplicate counts.
+    """
+    records = read_records(path)
+    books = []
+    seen = set()
+    stats = {"read": 0, "invalid": 0, "duplicate": 0, "added": 0}
+
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            break
+        stats["read"] += len(batch)
+        isbns = [clean_isbn(str(r.get("isbn") or "")) for r in batch]
+        for record, isbn, valid in zip(batch, isbns, valid_isbns(isbns)):
+            status = _text(record, "status") or "available"
+            # JSON Lines may hold numbers, e.g. {"title": 1984}
+            fields = (_text(record, "title"), _text(record, "author"))
+            # same rule as LibraryInventory.add_book (no commas in the text catalogue)
+            if not all(inventory.storage.accepts(f) for f in fields):
+                valid = False
+            if not valid or not all(fields) or status not in ("available", "issued"):
+                stats["invalid"] += 1
+                logging.info(f"Rejected bulk record: {record}")
+            elif isbn in seen:
+                stats["duplicate"] += 1
+            else:
+                seen.add(isbn)
+                books.append(Book(fields[0], fields[1], isbn, status))
+
+    stats["added"] = inventory.add_books(books)
+    stats["duplicate"] += len(books) - stats["added"]
+    return stats
+
+
+def export_catalogue(inventory, path):
+    """Streams every book to a .csv or .jsonl file, returns the number written."""
+    path = Path(path)
+    count = 0
+    with open(path, 'w', newline='', encoding='utf-8') as file:
+        if path.suffix == ".csv":
+            writer = csv.writer(file)
+            writer.writerow(FIELDS)
+        for book in inventory.display_all():
+            row = [book.title, book.author, book.isbn, book.status]
+            if path.suffix == ".csv":
+                writer.writerow(row)
+            else:
+                file.write(json.dumps(dict(zip(FIELDS, row))) + "\n")
+            count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import / export of the library catalogue")
+    parser.add_argument("command", choices=["import", "export"])
+    parser.add_argument("file", help="a .csv or .jsonl catalogue dump")
+    parser.add_argument("--catalogue", default="catolog.txt")
+    mapping = parser.add_mutually_exclusive_group()
+    mapping.add_argument("--lazy", dest="lazy", action="store_true", default=None,
+                         help="memory-map the text catalogue (default: only when it is large)")
+    mapping.add_argument("--eager", dest="lazy", action="store_false",
+                         help="load the whole text catalogue into memory")
+    args = parser.parse_args()
+
+    inventory = LibraryInventory(args.catalogue, lazy=args.lazy)
+    start = time.perf_counter()
+    try:
+        if args.command == "import":
+            stats = import_catalogue(inventory, args.file)
+            count = stats["read"]
+            print(f"Added {stats['added']} books, rejected {stats['invalid']} invalid "
+                  f"and {stats['duplicate']} duplicate records.")
+        else:
+            count = export_catalogue(inventory, args.file)
+            print(f"Exported {count} books to {args.file}.")
+    finally:
+        inventory.close()
+    elapsed = time.perf_counter() - start
+    print(f"Throughput: {count / elapsed if elapsed else 0:.0f} books/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+import os
+import mmap
+import logging
+import numpy as np
+from book import Book
+
+# In-memory containers for the books of a text catalogue. Both offer
+# len(), iteration, get(isbn), append(book), lines() (the snapshot as
+# encoded lines), close() and reopen(file_path), which takes over a snapshot
+# written from lines().
+
+
+class BookList:
+    """Decodes every book of the snapshot up front."""
+
+    def __init__(self, file_path):
+        self.books = []
+        self.by_isbn = {}
+        with open(file_path, 'r') as file:
+            for number, line in enumerate(file, start=1):
+                if line.strip():
+                    try:
+                        book = Book.from_line(line)
+                    except ValueError:
+                        # one damaged line must not cost the whole catalogue
+                        logging.error(f"Skipping bad catalogue line {number}: {line!r}")
+                        continue
+                    if book.isbn not in self.by_isbn:
+                        self.append(book)
+
+    def __len__(self):
+        return len(self.books)
+
+    def __iter__(self):
+        return iter(self.books)
+
+    def get(self, isbn):
+        return self.by_isbn.get(isbn)
+
+    def append(self, book):
+        self.books.append(book)
+        self.by_isbn[book.isbn] = book
+
+    def lines(self):
+        return (book.to_line().encode() for book in self.books)
+
+    def close(self):
+        pass
+
+    def reopen(self, file_path):
+        # the snapshot holds exactly these books, nothing to re-read
+        pass
+
+
+class MappedCatalog:
+    """Memory-maps the snapshot and only decodes the records that are used.
+
+    Loading just finds the line boundaries (one numpy pass over the file).
+    A record becomes a Book the first time it is looked up, and that Book
+    is kept so changes to it stick. Iterating decodes throw-away copies of
+    the untouched records instead of keeping them all in memory.
+    """
+
+    def __init__(self, file_path):
+        self._map(file_path)
+        self.decoded = {}
+        self.extra = []
+        self.extra_by_isbn = {}
+        # hash(isbn) of every row, sorted, plus the row each hash belongs to;
+        # built on the first lookup
+        self.isbn_hashes = None
+        self.isbn_rows = None
+
+    def _map(self, file_path):
+        self.file = open(file_path, 'rb')
+        size = os.fstat(self.file.fileno()).st_size
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+        data = np.frombuffer(self.map, dtype=np.uint8)
+        ends = np.flatnonzero(data == ord("\n"))
+        if size and data[-1] != ord("\n"):
+            ends = np.append(ends, size)
+        starts = np.concatenate(([0], ends[:-1] + 1)).astype(np.int64)
+        # the numpy view has to go before the map can be closed
+        del data
+        keep = ends - starts > 1
+        self.starts = starts[keep]
+        self.ends = ends[keep]
+
+    def _decode(self, row):
+        """The Book of a row, None (logged) for a damaged line."""
+        line = self.map[self.starts[row]:self.ends[row]].decode(errors="replace")
+        try:
+            return Book.from_line(line)
+        except ValueError:
+            logging.error(f"Skipping bad catalogue line: {line!r}")
+            return None
+
+    def _book(self, row):
+        book = self.decoded.get(row)
+        if book is None:
+            book = self._decode(row)
+            if book is not None:
+                self.decoded[row] = book
+        return book
+
+    def __len__(self):
+        return len(self.starts) + len(self.extra)
+
+    def __iter__(self):
+        for row in range(len(self.starts)):
+            book = self.decoded.get(row)
+            if book is None:
+                book = self._decode(row)
+            if book is not None:
+                yield book
+        yield from self.extra
+
+    def lines(self):
+        """Untouched records are copied from the map as they are, only
+        the decoded (possibly changed) and appended books are encoded."""
+        row = 0
+        for changed in sorted(self.decoded):
+            if changed > row:
+                yield self.map[self.starts[row]:self.ends[changed - 1] + 1]
+            yield self.decoded[changed].to_line().encode()
+            row = changed + 1
+        if row < len(self.starts):
+            tail = self.map[self.starts[row]:self.ends[-1] + 1]
+            # the last line of a hand-edited file may lack its newline
+            yield tail if tail.endswith(b"\n") else tail + b"\n"
+        for book in self.extra:
+            yield book.to_line().encode()
+
+    def _index_isbns(self):
+        hashes = np.fromiter(
+            # the second to last field; a damaged line hashes to something
+            # that get() rejects when the row doesn't decode
+            (hash(self.map[start:end].rsplit(b",", 2)[-2:][0])
+             for start, end in zip(self.starts.tolist(), self.ends.tolist())),
+            dtype=np.int64, count=len(self.starts),
+        )
+        self.isbn_rows = np.argsort(hashes, kind="stable")
+        self.isbn_hashes = hashes[self.isbn_rows]
+
+    def get(self, isbn):
+        book = self.extra_by_isbn.get(isbn)
+        if book is not None:
+            return book
+        if self.isbn_hashes is None:
+            self._index_isbns()
+        key = hash(isbn.encode())
+        position = np.searchsorted(self.isbn_hashes, key)
+        # different ISBNs can share a hash, so check the decoded record
+        while position < len(self.isbn_hashes) and self.isbn_hashes[position] == key:
+            book = self._book(int(self.isbn_rows[position]))
+            if book is not None and book.isbn == isbn:
+                return book
+            position += 1
+        return None
+
+    def append(self, book):
+        self.extra.append(book)
+        self.extra_by_isbn[book.isbn] = book
+
+    def close(self):
+        if isinstance(self.map, mmap.mmap):
+            self.map.close()
+        self.file.close()
+
+    def reopen(self, file_path):
+        """Maps a snapshot written by iterating this catalogue (its rows, then
+        the appended books) after close(). Decoded books and the ISBN index
+        carry over, the appended books become the last rows."""
+        rows = len(self.starts)
+        self._map(file_path)
+        if len(self.starts) != rows + len(self.extra):
+            # not the expected layout, decode from scratch
+            self.decoded = {}
+            self.isbn_hashes = self.isbn_rows = None
+        else:
+            new_rows = np.arange(rows, rows + len(self.extra))
+            self.decoded.update(zip(new_rows.tolist(), self.extra))
+            if self.isbn_hashes is not None and self.extra:
+                hashes = np.fromiter((hash(b.isbn.encode()) for b in self.extra),
+                                     dtype=np.int64, count=len(self.extra))
+                order = np.argsort(hashes, kind="stable")
+                positions = np.searchsorted(self.isbn_hashes, hashes[order], side="right")
+                self.isbn_hashes = np.insert(self.isbn_hashes, positions, hashes[order])
+                self.isbn_rows = np.insert(self.isbn_rows, positions, new_rows[order])
+        self.extra = []
+        self.extra_by_isbn = {}
@@ -1,51 +1,103 @@
 import logging
 from pathlib import Path
 from book import Book
+from storage import open_storage
+from search_index import TrigramIndex
 
 logging.basicConfig(filename="library.log",
                     level=logging.INFO,
                     format="%(asctime)s - %(levelname)s - %(message)s")
 
 class LibraryInventory:
-    def _init__ (self,file_path="catolog.txt"):
+    def __init__(self, file_path="catolog.txt", storage=None, lazy=None):
         self.file_path = Path(file_path)
-        self.books = []
-        self.load_inventory()
-
-    def load_data(self):
-        try:
-            if not self.file_path.exists():
-                self.file_path.write_text("")
-
-            with open(self.file_path, 'r') as file:
-                for line in file:
-                    if line.strip():
-                        self.books.append(Book.from_line(line))
-
-        except Exception as e:
-            logging.error(f"Error loading file: {e}")
-    
-    def save_data(self):
-        try:
-            with open(self.file_path, 'w') as file:
-                for book in self.books:
-                    file.write(book.to_line())
-        except Exception as e:
-            logging.error(f"Error saving data: {e}")
+        # catolog.txt keeps the text snapshot + journal, a .db path uses SQLite;
+        # lazy memory-maps the text snapshot (None: only when it is large)
+        self.storage = storage or open_storage(self.file_path, lazy=lazy)
+        # the search index is built on first use, so startup only pays for
+        # what the storage backend has to load
+        self._index = None
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = TrigramIndex()
+            self._index.add_many((b.isbn, b.title, b.author) for b in self.storage.iter_books())
+        return self._index
 
     def add_book(self,title, author, isbn):
+        """Adds one book, False if its ISBN is already in the inventory.
+
+        Raises ValueError for an empty field or a field the storage can't
+        hold (a comma in the text catalogue).
+        """
+        if not (title and author and isbn):
+            raise ValueError("Title, author and ISBN are all required.")
+        if not all(self.storage.accepts(field) for field in (title, author, isbn)):
+            raise ValueError("Title, author and ISBN can't contain commas or line breaks.")
         new_book = Book(title, author, isbn)
-        self.books.append(new_book)
-        self.save_data()
+        if not self.storage.add(new_book):
+            logging.info(f"Book already in inventory: {new_book}")
+            return False
+        if self._index is not None:
+            self._index.add(isbn, title, author)
         logging.info(f"Added book: {new_book}")
+        return True
+
+    def add_books(self, books):
+        """Adds many books with a single storage write, skipping known ISBNs.
+
+        Returns the number of books actually added.
+        """
+        new_books = [b for b in books if self.storage.get(b.isbn) is None]
+        count = self.storage.add_many(new_books)
+        if self._index is not None:
+            self._index.add_many((b.isbn, b.title, b.author) for b in new_books)
+        logging.info(f"Bulk added {count} books")
+        return count
+
+    def issue_book(self, isbn):
+        if self.storage.issue(isbn):
+            logging.info(f"Issued book: {isbn}")
+            return True
+        return False
+
+    def return_book(self, isbn):
+        if self.storage.return_book(isbn):
+            logging.info(f"Returned book: {isbn}")
+            return True
+        return False
+
+    def flush(self):
+        self.storage.flush()
+
+    def close(self):
+        self.storage.close()
 
     def search_by_title(self,title):
-        return [b for b in self.books if title.lower() in b.title.lower()]
+        return self.storage.search_title(title)
+
+    def fuzzy_search(self, query, limit=10):
+        """Best matching books by title or author, tolerating misspellings."""
+        results = []
+        for score, isbn in self.index.search(query, limit):
+            book = self.storage.get(isbn)
+            if book:
+                results.append(book)
+        return results
+
+    def autocomplete(self, prefix, limit=10):
+        return self.index.autocomplete(prefix, limit)
+
+    def search_by_isbn(self, isbn):
+        return self.storage.get(isbn)
+
+    def search_by_author(self,isbn):
+        return self.storage.get(isbn)
+
+    def books_by_author(self, author):
+        return self.storage.search_author(author)
 
-    def search_by_author(self,isbn): 
-        return next((b for b in self.books if b.isbn == isbn), None)
-    
     def display_all(self):
-        return self.books
-    
-    
\ No newline at end of file
+        return self.storage.iter_books()
+
@@ -0,0 +1,83 @@
+import os
+import csv
+import io
+import logging
+from pathlib import Path
+
+
+class Journal:
+    """Append-only log of inventory events (add / issue / return).
+
+    Every record is one CSV line (quoted where a field needs it), so a
+    transaction costs a single small append instead of rewriting the whole
+    catalogue. Records are flushed to the OS on every append but
+    only fsync'ed once every `sync_every` records to batch the disk syncs.
+    """
+
+    def __init__(self, file_path, sync_every=16):
+        self.file_path = Path(file_path)
+        self.sync_every = sync_every
+        self.pending = 0
+        self.records = 0
+        self.file = None
+
+    def replay(self):
+        """Yields the fields of every complete record in the journal.
+
+        A torn last line (crash in the middle of a write) is cut off, so the
+        next append starts on a fresh line instead of being glued onto it.
+        """
+        if not self.file_path.exists():
+            return
+        complete = 0    # byte offset just past the last complete record
+        torn = False
+        with open(self.file_path, 'rb') as file:
+            for line in file:
+                if not line.endswith(b"\n"):
+                    logging.error(f"Cutting off incomplete journal record: {line!r}")
+                    torn = True
+                    break
+                complete += len(line)
+                text = line.decode('utf-8', errors='replace').strip()
+                if text:
+                    self.records += 1
+                    yield next(csv.reader([text]))
+        if torn:
+            os.truncate(self.file_path, complete)
+
+    def open(self):
+        self.file = open(self.file_path, 'a')
+
+    def append(self, *fields):
+        self.append_many([fields])
+
+    def append_many(self, records):
+        """Writes several records with a single write call."""
+        if self.file is None:
+            self.open()
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(records)
+        self.file.write(buffer.getvalue())
+        self.file.flush()
+        self.pending += len(records)
+        self.records += len(records)
+        if self.pending >= self.sync_every:
+            self.sync()
+
+    def sync(self):
+        if self.file is not None and self.pending:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+        self.pending = 0
+
+    def reset(self):
+        """Empties the journal once its records are part of a snapshot."""
+        self.close()
+        self.file = open(self.file_path, 'w')
+        self.records = 0
+
+    def close(self):
+        if self.file is not None:
+            self.sync()
+            self.file.close()
+            self.file = None
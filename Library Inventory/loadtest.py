@@ -0,0 +1,76 @@
+import json
+import time
+import random
+import asyncio
+import argparse
+
+# Load test for server.py: many desks issuing and returning the same small
+# set of books at once. Reports transactions/sec and latency percentiles,
+# and checks that no copy was ever issued twice.
+
+
+async def request(reader, writer, message):
+    writer.write((json.dumps(message) + "\n").encode())
+    await writer.drain()
+    return json.loads(await reader.readline())
+
+
+async def desk(host, port, isbns, requests, latencies, balance):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(requests):
+            isbn = random.choice(isbns)
+            op = random.choice(("issue", "return"))
+            start = time.perf_counter()
+            response = await request(reader, writer, {"op": op, "isbn": isbn})
+            latencies.append(time.perf_counter() - start)
+            if response["ok"]:
+                balance[isbn] += 1 if op == "issue" else -1
+    finally:
+        writer.close()
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0
+    return sorted_values[min(len(sorted_values) - 1, int(q / 100 * len(sorted_values)))]
+
+
+async def run(args):
+    isbns = [f"LOADTEST{n:06d}" for n in range(args.books)]
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    for isbn in isbns:
+        await request(reader, writer, {"op": "add", "title": f"Load test {isbn}",
+                                       "author": "Load Test", "isbn": isbn})
+        # start every run from "available"
+        await request(reader, writer, {"op": "return", "isbn": isbn})
+    writer.close()
+
+    latencies = []
+    balance = dict.fromkeys(isbns, 0)
+    start = time.perf_counter()
+    await asyncio.gather(*(desk(args.host, args.port, isbns, args.requests, latencies, balance)
+                           for _ in range(args.clients)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"{len(latencies)} requests from {args.clients} desks in {elapsed:.2f} s")
+    print(f"Transactions/sec: {len(latencies) / elapsed:.0f}")
+    print(f"Latency p50: {percentile(latencies, 50) * 1000:.2f} ms, "
+          f"p99: {percentile(latencies, 99) * 1000:.2f} ms")
+    double_issued = [isbn for isbn, count in balance.items() if count not in (0, 1)]
+    print(f"Double issues: {len(double_issued)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test for the circulation service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=200, help="requests per client")
+    parser.add_argument("--books", type=int, default=20)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
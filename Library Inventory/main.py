@@ -1,6 +1,9 @@
+import sys
 from inventory import LibraryInventory
 
-Inventory = LibraryInventory ()
+# python main.py [catolog.txt | catolog.db]
+# (a large catolog.txt is memory-mapped, see storage.LAZY_SIZE)
+Inventory = LibraryInventory (sys.argv[1] if len(sys.argv) > 1 else "catolog.txt")
 
 def menu():
     print("\n==== Library Inventory Manager  ====")
@@ -23,23 +26,26 @@ while True:
         title = input("Enter book title: ")
         author = input("Enter book author: ")
         isbn = input("Enter book ISBN: ")
-        Inventory.add_book(title, author, isbn)
-        print("Book added successfully.")
+        try:
+            added = Inventory.add_book(title, author, isbn)
+        except ValueError as e:
+            print(e)
+        else:
+            if added:
+                print("Book added successfully.")
+            else:
+                print("A book with that ISBN already exists.")
 
     elif choice == 2:
         isbn = input("Enter book ISBN to issue: ")
-        book = Inventory.search_by_author(isbn)
-        if book and book.issue():
-            Inventory.save_data()
+        if Inventory.issue_book(isbn):
             print("Book issued successfully.")
         else:
             print("Book not available for issue.")
 
     elif choice == 3:
         isbn = input("Enter book ISBN to return: ")
-        book = Inventory.search_by_author(isbn)
-        if book and book.return_book():
-            Inventory.save_data()
+        if Inventory.return_book(isbn):
             print("Book returned successfully.")
         else:
             print("Book not found or not issued.")
@@ -50,14 +56,21 @@ while True:
 
     elif choice == 5:
         keyword= input("Enter title keyword to search: ")
-        results = Inventory.search_by_title(keyword)
-        if results:
-            for b in results:
-                print(b)
-        else:
-            print("No books found with that title.")
+        found = False
+        for b in Inventory.search_by_title(keyword):
+            print(b)
+            found = True
+        if not found:
+            suggestions = Inventory.fuzzy_search(keyword, limit=5)
+            if suggestions:
+                print("No exact match. Did you mean:")
+                for b in suggestions:
+                    print(b)
+            else:
+                print("No books found with that title.")
 
     elif choice == 6:
+        Inventory.close()
         print("Goodbye!,have a nice day.")
         break
     else:
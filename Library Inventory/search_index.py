@@ -0,0 +1,128 @@
+import re
+import heapq
+from array import array
+from bisect import bisect_left, insort
+import numpy as np
+
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+
+
+def normalize(text):
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+
+def trigrams(text):
+    """Set of the padded character trigrams of every word in text."""
+    grams = set()
+    for word in normalize(text).split():
+        padded = f"  {word} "
+        for i in range(len(padded) - 2):
+            grams.add(padded[i:i + 3])
+    return grams
+
+
+class TrigramIndex:
+    """Inverted trigram index over book titles and authors.
+
+    Titles and authors are indexed as separate entries that point back to
+    the book's ISBN. Postings are compact arrays of entry ids, so adding a
+    book is a handful of appends and the index never has to be rebuilt.
+    """
+
+    def __init__(self, max_scan=5000, min_score=0.3):
+        # number of posting entries a query may scan to collect candidates,
+        # keeps lookups fast however large the catalogue gets
+        self.max_scan = max_scan
+        self.min_score = min_score
+        self.isbns = []
+        self.sizes = array('H')
+        self.postings = {}
+        # (normalized title, original title) kept sorted for autocomplete
+        self.titles = []
+
+    def _add_entry(self, isbn, text):
+        grams = trigrams(text)
+        entry = len(self.isbns)
+        self.isbns.append(isbn)
+        self.sizes.append(min(len(grams), 65535))
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if posting is None:
+                posting = self.postings[gram] = array('I')
+            posting.append(entry)
+
+    def add(self, isbn, title, author):
+        self._add_entry(isbn, title)
+        self._add_entry(isbn, author)
+        insort(self.titles, (normalize(title), title))
+
+    def add_many(self, books):
+        """Bulk load of (isbn, title, author) tuples, sorting titles once."""
+        new_titles = []
+        for isbn, title, author in books:
+            self._add_entry(isbn, title)
+            self._add_entry(isbn, author)
+            new_titles.append((normalize(title), title))
+        self.titles.extend(new_titles)
+        self.titles.sort()
+
+    def search(self, query, limit=10):
+        """Ranked fuzzy matches as a list of (score, isbn), best first.
+
+        The score is the Dice coefficient between the trigram sets of the
+        query and the title (or author), so misspellings still score high.
+        """
+        grams = trigrams(query)
+        if not grams:
+            return []
+        # zero-copy numpy views of the posting arrays, released on return
+        postings = sorted(
+            (np.frombuffer(self.postings[g], dtype=np.uint32)
+             for g in grams if g in self.postings),
+            key=len,
+        )
+        if not postings:
+            return []
+
+        # candidates come from the rarest trigrams until the scan budget is
+        # used up, the common ones are then only probed with a binary search
+        # (entry ids are appended in order, so every posting is sorted)
+        scanned = len(postings[0])
+        probe_from = 1
+        while probe_from < len(postings) and scanned + len(postings[probe_from]) <= self.max_scan:
+            scanned += len(postings[probe_from])
+            probe_from += 1
+        entries, counts = np.unique(np.concatenate(postings[:probe_from]), return_counts=True)
+        for posting in postings[probe_from:]:
+            position = np.minimum(np.searchsorted(posting, entries), len(posting) - 1)
+            counts += posting[position] == entries
+
+        sizes = np.frombuffer(self.sizes, dtype=np.uint16)[entries]
+        scores = 2 * counts / (len(grams) + sizes)
+        keep = scores >= self.min_score
+        entries, scores = entries[keep], scores[keep]
+        # a book can match on both title and author, so take a few extra
+        if len(scores) > 2 * limit:
+            top = np.argpartition(-scores, 2 * limit)[:2 * limit]
+            entries, scores = entries[top], scores[top]
+
+        best = {}
+        for entry, score in zip(entries.tolist(), scores.tolist()):
+            isbn = self.isbns[entry]
+            if score > best.get(isbn, 0):
+                best[isbn] = score
+        return heapq.nlargest(limit, ((s, i) for i, s in best.items()))
+
+    def autocomplete(self, prefix, limit=10):
+        """Titles starting with prefix (case and punctuation insensitive)."""
+        prefix = normalize(prefix)
+        results = []
+        position = bisect_left(self.titles, (prefix, ""))
+        while position < len(self.titles) and len(results) < limit:
+            key, title = self.titles[position]
+            if not key.startswith(prefix):
+                break
+            if not results or results[-1] != title:
+                results.append(title)
+            position += 1
+        return results
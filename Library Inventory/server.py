@@ -0,0 +1,168 @@
+import json
+import asyncio
+import logging
+import argparse
+from inventory import LibraryInventory
+from storage import open_storage
+
+# Circulation service: many desks talk to one LibraryInventory over TCP.
+# One JSON object per line in each direction, e.g.
+#   {"op": "issue", "isbn": "9780451524935"}  ->  {"ok": true}
+# ops: add (title, author, isbn), issue (isbn), return (isbn),
+#      search (query, limit), fuzzy (query, limit)
+
+
+def _book_dict(book):
+    return {"title": book.title, "author": book.author,
+            "isbn": book.isbn, "status": book.status}
+
+
+class CirculationServer:
+    def __init__(self, inventory, flush_interval=0.005, batch_size=256):
+        self.inventory = inventory
+        # changes are made durable in groups: every flush_interval seconds or
+        # as soon as batch_size changes are waiting, whichever comes first
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.waiting = []
+        self.batch_full = asyncio.Event()
+        self.locks = {}
+        self.transactions = 0
+
+    async def _lock(self, isbn):
+        lock, users = self.locks.get(isbn, (None, 0))
+        if lock is None:
+            lock = asyncio.Lock()
+        self.locks[isbn] = (lock, users + 1)
+        await lock.acquire()
+        return lock
+
+    def _unlock(self, isbn, lock):
+        lock.release()
+        users = self.locks[isbn][1] - 1
+        if users:
+            self.locks[isbn] = (lock, users)
+        else:
+            del self.locks[isbn]
+
+    async def _durable(self):
+        """Waits until the changes made so far are flushed to disk."""
+        done = asyncio.get_running_loop().create_future()
+        self.waiting.append(done)
+        if len(self.waiting) >= self.batch_size:
+            self.batch_full.set()
+        await done
+
+    async def committer(self):
+        while True:
+            try:
+                await asyncio.wait_for(self.batch_full.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self.batch_full.clear()
+            if not self.waiting:
+                continue
+            waiting, self.waiting = self.waiting, []
+            try:
+                self.inventory.flush()
+            except Exception as e:
+                logging.error(f"Error flushing inventory: {e}")
+                for done in waiting:
+                    done.set_exception(e)
+                continue
+            for done in waiting:
+                done.set_result(None)
+
+    async def _change(self, isbn, action, *args):
+        # one desk at a time per copy, and the lock is held until the change
+        # is on disk so no desk ever sees a state that could still be lost
+        lock = await self._lock(isbn)
+        try:
+            ok = action(*args)
+            if ok:
+                await self._durable()
+                self.transactions += 1
+            return ok
+        finally:
+            self._unlock(isbn, lock)
+
+    async def handle(self, request):
+        op = request.get("op")
+        if op == "add":
+            ok = await self._change(request["isbn"], self.inventory.add_book,
+                                    request["title"], request["author"], request["isbn"])
+            return {"ok": ok}
+        if op == "issue":
+            return {"ok": await self._change(request["isbn"], self.inventory.issue_book, request["isbn"])}
+        if op == "return":
+            return {"ok": await self._change(request["isbn"], self.inventory.return_book, request["isbn"])}
+        if op in ("search", "fuzzy"):
+            limit = int(request.get("limit", 20))
+            if op == "search":
+                books = []
+                for book in self.inventory.search_by_title(request["query"]):
+                    books.append(book)
+                    if len(books) >= limit:
+                        break
+            else:
+                books = self.inventory.fuzzy_search(request["query"], limit)
+            return {"ok": True, "books": [_book_dict(b) for b in books]}
+        return {"ok": False, "error": f"unknown op {op!r}"}
+
+    async def serve_client(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = await self.handle(json.loads(line))
+                except (ValueError, KeyError) as e:
+                    response = {"ok": False, "error": f"bad request: {e}"}
+                except Exception as e:
+                    logging.error(f"Error handling request {line!r}: {e}")
+                    response = {"ok": False, "error": str(e)}
+                writer.write((json.dumps(response) + "\n").encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def run(self, host, port):
+        committer = asyncio.create_task(self.committer())
+        server = await asyncio.start_server(self.serve_client, host, port)
+        print(f"Circulation service listening on {host}:{port}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            committer.cancel()
+            self.inventory.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Library circulation service")
+    parser.add_argument("catalogue", nargs="?", default="catolog.txt")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--flush-interval", type=float, default=0.005)
+    mapping = parser.add_mutually_exclusive_group()
+    mapping.add_argument("--lazy", dest="lazy", action="store_true", default=None,
+                         help="memory-map the text catalogue (default: only when it is large)")
+    mapping.add_argument("--eager", dest="lazy", action="store_false",
+                         help="load the whole text catalogue into memory")
+    args = parser.parse_args()
+
+    # the server decides when to sync, not every single change
+    storage = open_storage(args.catalogue, lazy=args.lazy, sync_every=10**9)
+    server = CirculationServer(LibraryInventory(args.catalogue, storage),
+                               flush_interval=args.flush_interval)
+    try:
+        asyncio.run(server.run(args.host, args.port))
+    except KeyboardInterrupt:
+        print("Circulation service stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+import os
+import sys
+import sqlite3
+import logging
+from pathlib import Path
+from book import Book
+from journal import Journal
+from catalog import BookList, MappedCatalog
+
+# snapshots from this size on are memory-mapped unless lazy is given
+LAZY_SIZE = 64 * 1024 * 1024
+
+# Storage backends for LibraryInventory. Both expose the same methods:
+#   get(isbn), iter_books(), search_title(keyword), search_author(author),
+#   add(book), add_many(books), issue(isbn), return_book(isbn), flush(), close()
+# and accepts(text), whether a title / author can be stored as it is.
+
+
+class TextStorage:
+    """catolog.txt snapshot + append-only journal, held in memory.
+
+    With lazy=True the snapshot is memory-mapped and records are only
+    decoded when they are used (see catalog.MappedCatalog). The default,
+    lazy=None, does that for snapshots of LAZY_SIZE bytes or more.
+    """
+
+    def __init__(self, file_path="catolog.txt", sync_every=16, compact_every=1000, lazy=None):
+        self.file_path = Path(file_path)
+        self.lazy = lazy
+        self.books = None
+        # every change is appended to the journal, catolog.txt is only the
+        # snapshot it gets compacted into
+        self.journal = Journal(self.file_path.with_suffix(".journal"), sync_every)
+        self.compact_every = compact_every
+        self.load_data()
+
+    def load_data(self):
+        # damaged snapshot lines and journal records are logged and skipped;
+        # only a file that can't be read at all stops the load
+        try:
+            if not self.file_path.exists():
+                self.file_path.write_text("")
+
+            self._open_snapshot()
+            for record in self.journal.replay():
+                try:
+                    self._apply(record)
+                except (ValueError, IndexError) as e:
+                    # one bad record must not hide the ones after it
+                    logging.error(f"Skipping bad journal record {record}: {e}")
+
+        except OSError as e:
+            logging.error(f"Error loading file: {e}")
+            raise
+
+    def _open_snapshot(self):
+        if self.lazy is None:
+            self.lazy = self.file_path.stat().st_size >= LAZY_SIZE
+        if self.lazy:
+            self.books = MappedCatalog(self.file_path)
+        else:
+            self.books = BookList(self.file_path)
+
+    @staticmethod
+    def accepts(text):
+        # the snapshot is comma separated with one book per line
+        return "," not in text and "\n" not in text
+
+    def _add(self, book):
+        # replaying a journal on top of a snapshot that already holds the
+        # book must not add it twice
+        if self.books.get(book.isbn) is not None:
+            return False
+        self.books.append(book)
+        return True
+
+    def _apply(self, record):
+        action = record[0]
+        if action == "add":
+            title, author, isbn = record[1:]
+            self._add(Book(title, author, isbn))
+            return
+        book = self.books.get(record[1])
+        if book is None:
+            logging.error(f"Journal record for unknown ISBN: {record}")
+        elif action == "issue":
+            book.issue()
+        elif action == "return":
+            book.return_book()
+
+    def save_data(self):
+        """Writes a full snapshot of the catalogue and empties the journal."""
+        try:
+            temp_path = self.file_path.with_suffix(".tmp")
+            with open(temp_path, 'wb') as file:
+                file.writelines(self.books.lines())
+                file.flush()
+                os.fsync(file.fileno())
+            # a mapped snapshot has to be released before it is replaced;
+            # the books in memory stay, only the file is mapped again
+            self.books.close()
+            os.replace(temp_path, self.file_path)
+            self.books.reopen(self.file_path)
+            self.journal.reset()
+        except Exception as e:
+            logging.error(f"Error saving data: {e}")
+
+    def _record(self, *fields):
+        self.journal.append(*fields)
+        if self.journal.records >= self.compact_every:
+            self.save_data()
+
+    @staticmethod
+    def _add_records(book):
+        records = [("add", book.title, book.author, book.isbn)]
+        if book.status == "issued":
+            records.append(("issue", book.isbn))
+        return records
+
+    def get(self, isbn):
+        return self.books.get(isbn)
+
+    def iter_books(self):
+        return iter(self.books)
+
+    def search_title(self, keyword):
+        keyword = keyword.lower()
+        return (b for b in self.books if keyword in b.title.lower())
+
+    def search_author(self, author):
+        author = author.lower()
+        return (b for b in self.books if b.author.lower() == author)
+
+    def add(self, book):
+        if not self._add(book):
+            return False
+        self.journal.append_many(self._add_records(book))
+        if self.journal.records >= self.compact_every:
+            self.save_data()
+        return True
+
+    def add_many(self, books):
+        added = [book for book in books if self._add(book)]
+        if self.journal.records + len(added) >= self.compact_every:
+            # one snapshot write is cheaper than journaling a big batch
+            self.save_data()
+        else:
+            records = []
+            for book in added:
+                records.extend(self._add_records(book))
+            self.journal.append_many(records)
+            self.journal.sync()
+        return len(added)
+
+    def issue(self, isbn):
+        book = self.get(isbn)
+        if book and book.issue():
+            self._record("issue", isbn)
+            return True
+        return False
+
+    def return_book(self, isbn):
+        book = self.get(isbn)
+        if book and book.return_book():
+            self._record("return", isbn)
+            return True
+        return False
+
+    def flush(self):
+        self.journal.sync()
+
+    def close(self):
+        self.journal.close()
+        self.books.close()
+
+
+class SQLiteStorage:
+    """Catalogue kept in a SQLite database with indexed isbn/author and a
+    trigram full-text index for title substring search.
+
+    A B-tree index can't serve title LIKE '%keyword%', so titles are kept
+    in an FTS5 table with the trigram tokenizer (SQLite 3.34+). Keywords
+    shorter than three characters, or builds without FTS5, fall back to
+    scanning the table.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS books (
+            isbn   TEXT PRIMARY KEY,
+            title  TEXT NOT NULL,
+            author TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'available'
+        );
+        CREATE INDEX IF NOT EXISTS books_author ON books (author COLLATE NOCASE);
+        DROP INDEX IF EXISTS books_title;
+    """
+
+    # the index only holds the titles (content='books'); triggers keep it
+    # in step, status updates don't touch it
+    FTS_SCHEMA = """
+        CREATE VIRTUAL TABLE books_fts USING fts5(
+            title, content='books', content_rowid='rowid', tokenize='trigram'
+        );
+        CREATE TRIGGER books_fts_insert AFTER INSERT ON books BEGIN
+            INSERT INTO books_fts (rowid, title) VALUES (new.rowid, new.title);
+        END;
+        CREATE TRIGGER books_fts_delete AFTER DELETE ON books BEGIN
+            INSERT INTO books_fts (books_fts, rowid, title) VALUES ('delete', old.rowid, old.title);
+        END;
+        CREATE TRIGGER books_fts_update AFTER UPDATE OF title ON books BEGIN
+            INSERT INTO books_fts (books_fts, rowid, title) VALUES ('delete', old.rowid, old.title);
+            INSERT INTO books_fts (rowid, title) VALUES (new.rowid, new.title);
+        END;
+        INSERT INTO books_fts (books_fts) VALUES ('rebuild');
+    """
+
+    def __init__(self, file_path="catolog.db", sync_every=1):
+        self.file_path = Path(file_path)
+        # number of changes committed together, 1 commits every transaction
+        self.sync_every = sync_every
+        self.pending = 0
+        self.conn = sqlite3.connect(self.file_path)
+        self.conn.executescript(self.SCHEMA)
+        self.fts = self._create_fts()
+
+    def _create_fts(self):
+        if self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'books_fts'"
+        ).fetchone():
+            return True
+        try:
+            # also indexes the books of a database created before the index
+            self.conn.executescript(f"BEGIN; {self.FTS_SCHEMA} COMMIT;")
+            return True
+        except sqlite3.OperationalError as e:
+            self.conn.rollback()
+            logging.info(f"No trigram index, title search scans the table: {e}")
+            return False
+
+    @staticmethod
+    def accepts(text):
+        return True
+
+    @staticmethod
+    def _book(row):
+        return Book(*row)
+
+    def _query(self, sql, params=()):
+        # the cursor is iterated lazily, rows are only fetched as they are used
+        return (self._book(row) for row in self.conn.execute(sql, params))
+
+    def _changed(self, count=1):
+        self.pending += count
+        if self.pending >= self.sync_every:
+            self.flush()
+
+    def get(self, isbn):
+        row = self.conn.execute(
+            "SELECT title, author, isbn, status FROM books WHERE isbn = ?", (isbn,)
+        ).fetchone()
+        return self._book(row) if row else None
+
+    def iter_books(self):
+        return self._query("SELECT title, author, isbn, status FROM books ORDER BY rowid")
+
+    def search_title(self, keyword):
+        if self.fts and len(keyword) >= 3:
+            # a quoted trigram phrase matches the keyword anywhere in the
+            # title, case-insensitively, like the LIKE below
+            phrase = '"' + keyword.replace('"', '""') + '"'
+            return self._query(
+                "SELECT b.title, b.author, b.isbn, b.status FROM books_fts "
+                "JOIN books b ON b.rowid = books_fts.rowid "
+                "WHERE books_fts MATCH ? ORDER BY books_fts.rowid",
+                (phrase,),
+            )
+        keyword = keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return self._query(
+            "SELECT title, author, isbn, status FROM books "
+            "WHERE title LIKE ? ESCAPE '\\'",
+            (f"%{keyword}%",),
+        )
+
+    def search_author(self, author):
+        return self._query(
+            "SELECT title, author, isbn, status FROM books "
+            "WHERE author = ? COLLATE NOCASE",
+            (author,),
+        )
+
+    def add(self, book):
+        cursor = self.conn.execute(
+            "INSERT OR IGNORE INTO books (title, author, isbn, status) VALUES (?, ?, ?, ?)",
+            (book.title, book.author, book.isbn, book.status),
+        )
+        if cursor.rowcount != 1:
+            return False
+        self._changed()
+        return True
+
+    def add_many(self, books):
+        # rowcount leaves out the rows the title index triggers write
+        cursor = self.conn.executemany(
+            "INSERT OR IGNORE INTO books (title, author, isbn, status) VALUES (?, ?, ?, ?)",
+            ((b.title, b.author, b.isbn, b.status) for b in books),
+        )
+        self.flush()
+        return cursor.rowcount
+
+    def _set_status(self, isbn, old, new):
+        # the status check and the update happen in one statement, so two
+        # desks can never issue the same copy
+        cursor = self.conn.execute(
+            "UPDATE books SET status = ? WHERE isbn = ? AND status = ?", (new, isbn, old)
+        )
+        if cursor.rowcount != 1:
+            return False
+        self._changed()
+        return True
+
+    def issue(self, isbn):
+        return self._set_status(isbn, "available", "issued")
+
+    def return_book(self, isbn):
+        return self._set_status(isbn, "issued", "available")
+
+    def flush(self):
+        self.conn.commit()
+        self.pending = 0
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+
+def open_storage(file_path, lazy=None, **options):
+    """Picks the backend from the file extension (.db / .sqlite -> SQLite).
+
+    lazy only applies to the text catalogue, see TextStorage."""
+    file_path = Path(file_path)
+    if file_path.suffix in (".db", ".sqlite", ".sqlite3"):
+        return SQLiteStorage(file_path, **options)
+    return TextStorage(file_path, lazy=lazy, **options)
+
+
+def migrate_text_to_sqlite(text_path="catolog.txt", db_path="catolog.db"):
+    """Copies a text catalogue (snapshot + journal) into a SQLite database."""
+    source = TextStorage(text_path)
+    target = SQLiteStorage(db_path)
+    try:
+        count = target.add_many(source.iter_books())
+        logging.info(f"Migrated {count} books from {text_path} to {db_path}")
+        return count
+    finally:
+        source.close()
+        target.close()
+
+
+if __name__ == "__main__":
+    # python storage.py [catolog.txt] [catolog.db]
+    count = migrate_text_to_sqlite(*sys.argv[1:3])
+    print(f"Migrated {count} books.")
@@ -0,0 +1,36 @@
+import os
+import sys
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bulk import import_catalogue
+from inventory import LibraryInventory
+
+
+class BulkImportTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.dir.name)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_bad_json_line_is_counted_and_skipped(self):
+        path = self.root / "books.jsonl"
+        with open(path, "w") as file:
+            file.write(json.dumps({"title": "Dune", "author": "Herbert", "isbn": "9780441172719"}) + "\n")
+            file.write('{"title": "Broken", "author": \n')
+            file.write("[1, 2]\n")
+            file.write(json.dumps({"title": 1984, "author": "Orwell", "isbn": "9780451524935"}) + "\n")
+        inventory = LibraryInventory(self.root / "catolog.txt")
+        stats = import_catalogue(inventory, path)
+        self.assertEqual(stats, {"read": 4, "invalid": 2, "duplicate": 0, "added": 2})
+        self.assertEqual(inventory.search_by_isbn("9780451524935").title, "1984")
+        inventory.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
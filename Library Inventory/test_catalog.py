@@ -0,0 +1,93 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import storage
+from book import Book
+from catalog import MappedCatalog
+from storage import TextStorage
+
+
+class MappedCatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.dir.name) / "catolog.txt"
+        self.path.write_text("".join(f"Book {i},Author {i},{i},available\n" for i in range(50)))
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def rewrite(self, books):
+        # what TextStorage.save_data does
+        temp_path = self.path.with_suffix(".tmp")
+        with open(temp_path, "wb") as file:
+            file.writelines(books.lines())
+        books.close()
+        os.replace(temp_path, self.path)
+        books.reopen(self.path)
+
+    def test_lookup_index(self):
+        books = MappedCatalog(self.path)
+        self.assertEqual(books.get("17").title, "Book 17")
+        self.assertIsNone(books.get("50"))
+        books.get("3").issue()
+        self.assertEqual(books.get("3").status, "issued")
+        self.assertEqual(len(books), 50)
+        books.close()
+
+    def test_reopen_after_append(self):
+        books = MappedCatalog(self.path)
+        books.get("10").issue()
+        books.append(Book("Dune", "Herbert", "900"))
+        books.append(Book("Emma", "Austen", "901"))
+        self.rewrite(books)
+
+        self.assertEqual(len(books), 52)
+        self.assertEqual(books.extra, [])
+        self.assertEqual(books.get("900").title, "Dune")
+        self.assertEqual(books.get("901").author, "Austen")
+        self.assertEqual(books.get("10").status, "issued")
+        self.assertEqual(books.get("49").title, "Book 49")
+        books.append(Book("Ulysses", "Joyce", "902"))
+        self.rewrite(books)
+        self.assertEqual([b.isbn for b in books][-3:], ["900", "901", "902"])
+        books.close()
+
+        fresh = MappedCatalog(self.path)
+        self.assertEqual(fresh.get("902").title, "Ulysses")
+        self.assertEqual(fresh.get("10").status, "issued")
+        fresh.close()
+
+    def test_storage_compacts_lazily(self):
+        store = TextStorage(self.path, compact_every=3, lazy=True)
+        for isbn in ("900", "901", "902", "903"):
+            store.add(Book("Title", "Author", isbn))
+        store.issue("900")
+        self.assertIsInstance(store.books, MappedCatalog)
+        store.close()
+
+        store = TextStorage(self.path, lazy=True)
+        self.assertEqual(len(store.books), 54)
+        self.assertEqual(store.get("900").status, "issued")
+        store.close()
+
+    def test_large_snapshot_is_mapped_by_default(self):
+        saved = storage.LAZY_SIZE
+        try:
+            storage.LAZY_SIZE = self.path.stat().st_size
+            store = TextStorage(self.path)
+            self.assertIsInstance(store.books, MappedCatalog)
+            store.close()
+            storage.LAZY_SIZE = self.path.stat().st_size + 1
+            store = TextStorage(self.path)
+            self.assertNotIsInstance(store.books, MappedCatalog)
+            store.close()
+        finally:
+            storage.LAZY_SIZE = saved
+
+
+if __name__ == "__main__":
+    unittest.main()
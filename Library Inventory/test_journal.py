@@ -0,0 +1,68 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from book import Book
+from storage import TextStorage
+
+
+class JournalRecoveryTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.dir.name) / "catolog.txt"
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def reopen(self, storage):
+        storage.close()
+        return TextStorage(self.path)
+
+    def test_torn_record_is_cut_off_before_appending(self):
+        storage = TextStorage(self.path)
+        storage.add(Book("Dune", "Herbert", "111"))
+        storage.add(Book("Emma", "Austen", "222"))
+        storage.close()
+        # crash in the middle of writing the next record
+        with open(self.path.with_suffix(".journal"), "a") as file:
+            file.write("add,Neuro")
+
+        storage = TextStorage(self.path)
+        self.assertTrue(storage.issue("222"))
+        storage = self.reopen(storage)
+        self.assertEqual(storage.get("222").status, "issued")
+        self.assertIsNone(storage.get("Neuro"))
+        self.assertEqual(len(list(storage.iter_books())), 2)
+        storage.close()
+
+    def test_bad_record_is_skipped(self):
+        journal = self.path.with_suffix(".journal")
+        self.path.write_text("")
+        journal.write_text("add,Dune,Herbert,111\n"
+                           "add,Hello,World,Anon,333\n"
+                           "add,Emma,Austen,222\n"
+                           "issue,222\n")
+        storage = TextStorage(self.path)
+        self.assertIsNone(storage.get("333"))
+        self.assertEqual(storage.get("222").status, "issued")
+        storage.close()
+
+    def test_journal_fields_are_quoted(self):
+        storage = TextStorage(self.path)
+        storage.journal.append("add", "Hello, World", "Anon", "444")
+        storage = self.reopen(storage)
+        self.assertEqual(storage.get("444").title, "Hello, World")
+        storage.close()
+
+    def test_text_storage_rejects_commas(self):
+        storage = TextStorage(self.path)
+        self.assertFalse(storage.accepts("Hello, World"))
+        self.assertTrue(storage.accepts("Hello World"))
+        storage.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
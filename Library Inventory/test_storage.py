@@ -0,0 +1,38 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from book import Book
+from storage import TextStorage
+
+
+class SnapshotLoadTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.dir.name) / "catolog.txt"
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_bad_snapshot_line_is_skipped(self):
+        self.path.write_text("Dune,Herbert,111,available\n"
+                             "Emma,Austen,22,2,available\n"
+                             "Ulysses,Joyce,333,issued\n")
+        for lazy in (False, True):
+            storage = TextStorage(self.path, lazy=lazy)
+            self.assertEqual([b.isbn for b in storage.iter_books()], ["111", "333"])
+            self.assertEqual(storage.get("333").status, "issued")
+            self.assertIsNone(storage.get("22"))
+            storage.close()
+
+    def test_isbn_with_comma_is_rejected(self):
+        storage = TextStorage(self.path)
+        self.assertFalse(storage.accepts("12,3"))
+        storage.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,20 @@
+"""Weather data analysis (IMD maximum temperature, 2017).
+
+Importing the package loads pandas and numpy only: matplotlib is imported
+by create_visualizations and tabulate by export_results, and the output
+directory is created when those write to it.
+"""
+
+from .config import INPUT_FILE_NAME, OUTPUT_DIR, CLEANED_FILE_NAME, REPORT_FILE_NAME
+from .data import load_data, clean_data
+from .stats import analyze_statistics, group_and_aggregate
+
+
+def create_visualizations(df, output_dir):
+    from .plots import create_visualizations
+    return create_visualizations(df, output_dir)
+
+
+def export_results(df_clean, stats_summary, seasonal_stats, plot_paths, output_dir):
+    from .report import export_results
+    return export_results(df_clean, stats_summary, seasonal_stats, plot_paths, output_dir)
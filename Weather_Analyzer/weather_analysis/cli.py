@@ -0,0 +1,49 @@
+import argparse
+
+from . import load_data, clean_data, analyze_statistics, group_and_aggregate
+from .config import INPUT_FILE_NAME, OUTPUT_DIR
+
+
+# --- Main Execution Block ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Weather data analysis and visualization")
+    parser.add_argument("input_file", nargs="?", default=INPUT_FILE_NAME)
+    parser.add_argument("--output-dir", default=OUTPUT_DIR)
+    parser.add_argument("--summary-only", action="store_true",
+                        help="print the statistics without plotting or writing files")
+    args = parser.parse_args(argv)
+
+    # 1. Load Data (uses the uploaded Max_Temp_IMD_2017.csv)
+    df = load_data(args.input_file)
+    if df is None:
+        return 1
+
+    # 2. Clean Data
+    df_clean = clean_data(df)
+
+    # 3. Analyze Statistics
+    stats_summary = analyze_statistics(df_clean)
+
+    if args.summary_only:
+        # 5. Group and Aggregate, nothing is drawn or written
+        group_and_aggregate(df_clean)
+        return 0
+
+    # plotting and report modules are only loaded for a full run
+    from .plots import create_visualizations
+    from .report import export_results
+
+    # 4. Visualize Data
+    plot_paths = create_visualizations(df_clean, args.output_dir)
+
+    # 5. Group and Aggregate
+    seasonal_stats = group_and_aggregate(df_clean)
+
+    # 6. Export Results and Storytelling
+    export_results(df_clean, stats_summary, seasonal_stats, plot_paths, args.output_dir)
+
+    # Submission Checklist Reminder
+    print(
+        f"\n**SUCCESS!** All required files have been generated in the '{args.output_dir}' directory."
+    )
+    return 0
@@ -0,0 +1,7 @@
+# --- Configuration ---
+INPUT_FILE_NAME = "Max_Temp_IMD_2017.csv"
+OUTPUT_DIR = "weather_visualizer_output"
+CLEANED_FILE_NAME = "cleaned_weather_data.csv"
+REPORT_FILE_NAME = "analysis_report.md"
+
+# The output directory is created by the steps that write to it, not on import
@@ -0,0 +1,87 @@
+import os
+import pandas as pd
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+# Only imported when charts are drawn, so summaries never load matplotlib
+
+
+# ---   Task 4: Visualization with Matplotlib ---
+def create_visualizations(df, output_dir):
+    """Generates required plots using Matplotlib and saves them."""
+    print("\n--- Task 4: Visualization with Matplotlib ---")
+
+    plot_paths = []
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Prepare monthly data for the bar chart
+    monthly_rainfall = df["Rainfall_mm"].resample(pd.offsets.MonthEnd()).sum()
+    monthly_rainfall.index = monthly_rainfall.index.strftime("%b %Y")
+
+    # 4.1 Line chart for daily temperature trends
+    fig, ax = plt.subplots(figsize=(12, 6))
+    ax.plot(df.index, df["Max_Temp_C"], label="Daily Max Temperature", color="tab:red")
+    ax.set_title("Daily Maximum Temperature Trend (2017)")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Temperature (°C)")
+    ax.grid(True, linestyle="--", alpha=0.6)
+    fig.tight_layout()
+    line_chart_path = os.path.join(output_dir, "daily_temp_line_chart.png")
+    plt.savefig(line_chart_path)
+    plot_paths.append(line_chart_path)
+    plt.close(fig)
+
+    # 4.2 Bar chart for monthly rainfall totals
+    fig, ax = plt.subplots(figsize=(12, 6))
+    monthly_rainfall.plot(kind="bar", color="skyblue", ax=ax)
+    ax.set_title("Monthly Total Rainfall")
+    ax.set_xlabel("Month")
+    ax.set_ylabel("Rainfall (mm)")
+    plt.xticks(rotation=45)
+    ax.grid(axis="y", linestyle="--", alpha=0.7)
+    fig.tight_layout()
+    bar_chart_path = os.path.join(output_dir, "monthly_rainfall_bar_chart.png")
+    plt.savefig(bar_chart_path)
+    plot_paths.append(bar_chart_path)
+    plt.close(fig)
+
+    # 4.3 Scatter plot for humidity vs. temperature
+    fig, ax = plt.subplots(figsize=(8, 8))
+    ax.scatter(df["Max_Temp_C"], df["Humidity_Pct"], alpha=0.6, color="darkgreen")
+    ax.set_title("Maximum Temperature vs. Humidity Relationship")
+    ax.set_xlabel("Maximum Temperature (°C)")
+    ax.set_ylabel("Humidity (%)")
+    ax.grid(True, linestyle=":", alpha=0.5)
+    scatter_chart_path = os.path.join(output_dir, "temp_humidity_scatter_plot.png")
+    plt.savefig(scatter_chart_path)
+    plot_paths.append(scatter_chart_path)
+    plt.close(fig)
+
+    # 4.4 Combine at least two plots in a single figure (Line chart + Bar chart of data)
+    fig, ax1 = plt.subplots(figsize=(12, 6))  #
+
+    # Plot 1 (Left Y-axis): Temperature
+    color = "tab:red"
+    ax1.set_xlabel("Date")
+    ax1.set_ylabel("Max Temp (°C)", color=color)
+    ax1.plot(df.index, df["Max_Temp_C"], color=color, label="Max Temp")
+    ax1.tick_params(axis="y", labelcolor=color)
+
+    # Plot 2 (Right Y-axis): Rainfall (using Pandas resample for daily data)
+    ax2 = ax1.twinx()
+    color = "tab:blue"
+    ax2.set_ylabel("Daily Rainfall (mm)", color=color)
+    ax2.bar(df.index, df["Rainfall_mm"], color=color, alpha=0.4, label="Rainfall")
+    ax2.tick_params(axis="y", labelcolor=color)
+
+    fig.suptitle("Daily Max Temperature and Rainfall (Combined Plot)", fontsize=16)
+    fig.tight_layout(rect=[0, 0.03, 1, 0.95])
+
+    combined_chart_path = os.path.join(output_dir, "combined_temp_rainfall_chart.png")
+    plt.savefig(combined_chart_path)
+    plot_paths.append(combined_chart_path)
+    plt.close(fig)
+
+    return plot_paths
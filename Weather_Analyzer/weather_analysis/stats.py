@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+
+
+# ---   Task 3: Statistical Analysis with NumPy and Pandas Resampling ---
+def analyze_statistics(df):
+    """Computes daily, monthly, and yearly statistics."""
+    print("\n--- Task 3: Statistical Analysis with NumPy ---")
+
+    stats_summary = {}
+
+    # Calculate Daily Statistics (Overall Summary) using NumPy
+    overall_mean_temp = np.mean(df["Max_Temp_C"])
+    overall_max_temp = np.max(df["Max_Temp_C"])
+    overall_std_humidity = np.std(df["Humidity_Pct"])
+
+    stats_summary["Overall Mean Temperature"] = overall_mean_temp
+    stats_summary["Overall Max Temperature"] = overall_max_temp
+    stats_summary["Overall Std Dev of Humidity"] = overall_std_humidity
+
+    print(f"Overall Mean Max Temperature: {overall_mean_temp:.2f} C")
+
+    # Monthly Statistics (Using Pandas Resampling)
+    # (month-end offset object, newer pandas no longer accepts the "M" alias)
+    monthly_stats = df.resample(pd.offsets.MonthEnd()).agg(
+        {"Max_Temp_C": ["mean", "max"], "Rainfall_mm": "sum", "Humidity_Pct": "mean"}
+    )
+    # Flatten the multi-level column index for easier use
+    monthly_stats.columns = [
+        "_".join(col).strip() for col in monthly_stats.columns.values
+    ]
+    stats_summary["Monthly"] = monthly_stats
+    print("\nMonthly Statistics (Head):")
+    print(monthly_stats.head())
+
+    return stats_summary
+
+
+# ---   Task 5: Grouping and Aggregation ---
+# Define seasons based on Northern Hemisphere months
+def get_season(date):
+    month = date.month
+    if 3 <= month <= 5:
+        return "Spring (Mar-May)"
+    elif 6 <= month <= 8:
+        return "Summer (Jun-Aug)"
+    elif 9 <= month <= 11:
+        return "Autumn (Sep-Nov)"
+    else:
+        return "Winter (Dec-Feb)"
+
+
+def add_season(df):
+    """Adds the Season column (from the Date index) to df and returns it."""
+    df["Season"] = df.index.map(get_season)
+    return df
+
+
+def group_and_aggregate(df):
+    """Groups data by season and calculates aggregate statistics.
+
+    Adds the Season column to df, which the exported cleaned data keeps."""
+    print("\n--- Task 5: Grouping and Aggregation ---")
+
+    # Apply the function to the index (which is the Date)
+    add_season(df)
+
+    # Group data by season and calculate aggregate statistics
+    seasonal_stats = (
+        df.groupby("Season")
+        .agg(
+            Mean_Max_Temp=("Max_Temp_C", "mean"),
+            Total_Rainfall=("Rainfall_mm", "sum"),
+            Mean_Humidity=("Humidity_Pct", "mean"),
+            Days_Count=("Season", "size"),
+        )
+        .sort_values(by="Mean_Max_Temp", ascending=False)
+    )
+
+    print("\nSeasonal Aggregation Statistics:")
+    print(seasonal_stats)
+
+    return seasonal_stats
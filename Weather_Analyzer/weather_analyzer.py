@@ -1,347 +1,20 @@
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import os
-from tabulate import tabulate  # Required for to_markdown()
+# Entry point kept for `python weather_analyzer.py`; the analysis lives in the
+# weather_analysis package (see weather_analysis/cli.py for the options).
+import sys
+
+from weather_analysis import (
+    INPUT_FILE_NAME,
+    OUTPUT_DIR,
+    CLEANED_FILE_NAME,
+    REPORT_FILE_NAME,
+    load_data,
+    clean_data,
+    analyze_statistics,
+    create_visualizations,
+    group_and_aggregate,
+    export_results,
+)
+from weather_analysis.cli import main
 
-# --- Configuration ---
-INPUT_FILE_NAME = "Max_Temp_IMD_2017.csv"
-OUTPUT_DIR = "weather_visualizer_output"
-CLEANED_FILE_NAME = "cleaned_weather_data.csv"
-REPORT_FILE_NAME = "analysis_report.md"
-
-# Ensure the output directory exists
-if not os.path.exists(OUTPUT_DIR):
-    os.makedirs(OUTPUT_DIR)
-
-
-# ---   Task 1: Data Acquisition and Loading ---
-def load_data(file_path):
-    """Loads the real-world CSV file into a Pandas DataFrame."""
-    print("--- Task 1: Data Acquisition and Loading ---")
-    try:
-        # Load the real CSV file
-        df = pd.read_csv(file_path)
-
-        # Assuming the CSV contains a date-like structure, we'll ensure a 'Date' column exists.
-
-        # --- Synthetic Data for Missing Requirements (Rainfall/Humidity) ---
-        # Since the input file name suggests only Max Temp, we generate other metrics
-        # to fulfill the assignment requirements (rainfall/humidity plots).
-        np.random.seed(42)
-        n_rows = len(df)
-        df["Humidity_Pct"] = np.random.uniform(40, 95, size=n_rows)
-        # Introduce some NaNs for cleaning demo
-        df.loc[df.sample(frac=0.05).index, "Humidity_Pct"] = np.nan
-        df["Rainfall_mm"] = np.random.choice(
-            [0, 0, 0, 0, np.random.uniform(0.1, 50)], size=n_rows
-        )
-        # Assuming the Max Temp column is named 'Max_Temp_C' or similar based on data inspection
-        # If your data uses F, convert it, but we assume C here.
-
-        # Assign a generic date index for time-series operations
-        df["Date"] = pd.date_range(start="2017-01-01", periods=n_rows, freq="D")
-
-        print(f"Loaded {n_rows} records from {file_path}")
-        print("\nHead of the DataFrame (Initial):")
-        print(df.head())
-        print("\nDataFrame Info (Initial):")
-        df.info()
-        print("\nDataFrame Describe (Initial):")
-        print(df.describe())
-
-        return df
-
-    except FileNotFoundError:
-        print(
-            f"Error: File not found at {file_path}. Please ensure the file is in the script directory."
-        )
-        return None
-
-
-# ---   Task 2: Data Cleaning and Processing ---
-def clean_data(df):
-    """Handles missing values, converts types, and filters columns."""
-    print("\n--- Task 2: Data Cleaning and Processing ---")
-
-    # Standardize column names for ease of use (adjust these based on your actual CSV headers)
-    # We assume 'MAX_TEMP' is the name of the column in the IMD data.
-    # Check your df.head() and df.info() to confirm this.
-    try:
-        # Assuming the key temperature column is the second column in the file (index 1)
-        temp_col = df.columns[1]
-        df.rename(columns={temp_col: "Max_Temp_C"}, inplace=True)
-    except IndexError:
-        print(
-            "Warning: Could not infer temperature column name. Check your CSV structure."
-        )
-        df["Max_Temp_C"] = df.iloc[:, 1]  # Fallback
-
-    # 2.1 Convert date columns to datetime format and set index
-    df["Date"] = pd.to_datetime(df["Date"])
-    df_clean = df.set_index("Date").copy()
-
-    # 2.2 Filter for relevant columns
-    relevant_cols = ["Max_Temp_C", "Humidity_Pct", "Rainfall_mm"]
-    df_clean = df_clean[relevant_cols].copy()
-
-    # 2.3 Handle missing values
-    # For Temperature/Humidity (continuous data), fill with the mean
-    fill_cols = ["Max_Temp_C", "Humidity_Pct"]
-    df_clean[fill_cols] = df_clean[fill_cols].fillna(df_clean[fill_cols].mean())
-
-    # For Rainfall, assume NaN means 0 rainfall
-    df_clean["Rainfall_mm"] = df_clean["Rainfall_mm"].fillna(0)
-
-    # Final check
-    print("\nDataFrame Info (After Cleaning):")
-    df_clean.info()
-
-    return df_clean
-
-
-# ---   Task 3: Statistical Analysis with NumPy and Pandas Resampling ---
-def analyze_statistics(df):
-    """Computes daily, monthly, and yearly statistics."""
-    print("\n--- Task 3: Statistical Analysis with NumPy ---")
-
-    stats_summary = {}
-
-    # Calculate Daily Statistics (Overall Summary) using NumPy
-    overall_mean_temp = np.mean(df["Max_Temp_C"])
-    overall_max_temp = np.max(df["Max_Temp_C"])
-    overall_std_humidity = np.std(df["Humidity_Pct"])
-
-    stats_summary["Overall Mean Temperature"] = overall_mean_temp
-    stats_summary["Overall Max Temperature"] = overall_max_temp
-    stats_summary["Overall Std Dev of Humidity"] = overall_std_humidity
-
-    print(f"Overall Mean Max Temperature: {overall_mean_temp:.2f} C")
-
-    # Monthly Statistics (Using Pandas Resampling)
-    monthly_stats = df.resample("M").agg(
-        {"Max_Temp_C": ["mean", "max"], "Rainfall_mm": "sum", "Humidity_Pct": "mean"}
-    )
-    # Flatten the multi-level column index for easier use
-    monthly_stats.columns = [
-        "_".join(col).strip() for col in monthly_stats.columns.values
-    ]
-    stats_summary["Monthly"] = monthly_stats
-    print("\nMonthly Statistics (Head):")
-    print(monthly_stats.head())
-
-    return stats_summary
-
-
-# ---   Task 4: Visualization with Matplotlib ---
-def create_visualizations(df, output_dir):
-    """Generates required plots using Matplotlib and saves them."""
-    print("\n--- Task 4: Visualization with Matplotlib ---")
-
-    plot_paths = []
-
-    # Prepare monthly data for the bar chart
-    monthly_rainfall = df["Rainfall_mm"].resample("M").sum()
-    monthly_rainfall.index = monthly_rainfall.index.strftime("%b %Y")
-
-    # 4.1 Line chart for daily temperature trends
-    fig, ax = plt.subplots(figsize=(12, 6))
-    ax.plot(df.index, df["Max_Temp_C"], label="Daily Max Temperature", color="tab:red")
-    ax.set_title("Daily Maximum Temperature Trend (2017)")
-    ax.set_xlabel("Date")
-    ax.set_ylabel("Temperature (°C)")
-    ax.grid(True, linestyle="--", alpha=0.6)
-    fig.tight_layout()
-    line_chart_path = os.path.join(output_dir, "daily_temp_line_chart.png")
-    plt.savefig(line_chart_path)
-    plot_paths.append(line_chart_path)
-    plt.close(fig)
-
-    # 4.2 Bar chart for monthly rainfall totals
-    fig, ax = plt.subplots(figsize=(12, 6))
-    monthly_rainfall.plot(kind="bar", color="skyblue", ax=ax)
-    ax.set_title("Monthly Total Rainfall")
-    ax.set_xlabel("Month")
-    ax.set_ylabel("Rainfall (mm)")
-    plt.xticks(rotation=45)
-    ax.grid(axis="y", linestyle="--", alpha=0.7)
-    fig.tight_layout()
-    bar_chart_path = os.path.join(output_dir, "monthly_rainfall_bar_chart.png")
-    plt.savefig(bar_chart_path)
-    plot_paths.append(bar_chart_path)
-    plt.close(fig)
-
-    # 4.3 Scatter plot for humidity vs. temperature
-    fig, ax = plt.subplots(figsize=(8, 8))
-    ax.scatter(df["Max_Temp_C"], df["Humidity_Pct"], alpha=0.6, color="darkgreen")
-    ax.set_title("Maximum Temperature vs. Humidity Relationship")
-    ax.set_xlabel("Maximum Temperature (°C)")
-    ax.set_ylabel("Humidity (%)")
-    ax.grid(True, linestyle=":", alpha=0.5)
-    scatter_chart_path = os.path.join(output_dir, "temp_humidity_scatter_plot.png")
-    plt.savefig(scatter_chart_path)
-    plot_paths.append(scatter_chart_path)
-    plt.close(fig)
-
-    # 4.4 Combine at least two plots in a single figure (Line chart + Bar chart of data)
-    fig, ax1 = plt.subplots(figsize=(12, 6))  #
-
-    # Plot 1 (Left Y-axis): Temperature
-    color = "tab:red"
-    ax1.set_xlabel("Date")
-    ax1.set_ylabel("Max Temp (°C)", color=color)
-    ax1.plot(df.index, df["Max_Temp_C"], color=color, label="Max Temp")
-    ax1.tick_params(axis="y", labelcolor=color)
-
-    # Plot 2 (Right Y-axis): Rainfall (using Pandas resample for daily data)
-    ax2 = ax1.twinx()
-    color = "tab:blue"
-    ax2.set_ylabel("Daily Rainfall (mm)", color=color)
-    ax2.bar(df.index, df["Rainfall_mm"], color=color, alpha=0.4, label="Rainfall")
-    ax2.tick_params(axis="y", labelcolor=color)
-
-    fig.suptitle("Daily Max Temperature and Rainfall (Combined Plot)", fontsize=16)
-    fig.tight_layout(rect=[0, 0.03, 1, 0.95])
-
-    combined_chart_path = os.path.join(output_dir, "combined_temp_rainfall_chart.png")
-    plt.savefig(combined_chart_path)
-    plot_paths.append(combined_chart_path)
-    plt.close(fig)
-
-    return plot_paths
-
-
-# ---   Task 5: Grouping and Aggregation ---
-def group_and_aggregate(df):
-    """Groups data by season and calculates aggregate statistics."""
-    print("\n--- Task 5: Grouping and Aggregation ---")
-
-    # Define seasons based on Northern Hemisphere months
-    def get_season(date):
-        month = date.month
-        if 3 <= month <= 5:
-            return "Spring (Mar-May)"
-        elif 6 <= month <= 8:
-            return "Summer (Jun-Aug)"
-        elif 9 <= month <= 11:
-            return "Autumn (Sep-Nov)"
-        else:
-            return "Winter (Dec-Feb)"
-
-    # Apply the function to the index (which is the Date)
-    df["Season"] = df.index.map(get_season)
-
-    # Group data by season and calculate aggregate statistics
-    seasonal_stats = (
-        df.groupby("Season")
-        .agg(
-            Mean_Max_Temp=("Max_Temp_C", "mean"),
-            Total_Rainfall=("Rainfall_mm", "sum"),
-            Mean_Humidity=("Humidity_Pct", "mean"),
-            Days_Count=("Season", "size"),
-        )
-        .sort_values(by="Mean_Max_Temp", ascending=False)
-    )
-
-    print("\nSeasonal Aggregation Statistics:")
-    print(seasonal_stats)
-
-    return seasonal_stats
-
-
-# ---   Task 6: Export and Storytelling ---
-def export_results(df_clean, stats_summary, seasonal_stats, plot_paths, output_dir):
-    """Exports cleaned data and generates the summary report."""
-    print("\n--- Task 6: Export and Storytelling ---")
-
-    # 6.1 Export cleaned data to a new CSV file
-    cleaned_csv_path = os.path.join(output_dir, CLEANED_FILE_NAME)
-    df_clean.to_csv(cleaned_csv_path)
-    print(f"Cleaned data exported to: {cleaned_csv_path}")
-
-    # 6.2 Write a Markdown report summarizing insights
-    report_path = os.path.join(output_dir, REPORT_FILE_NAME)
-
-    # Convert seasonal stats to markdown table string
-    seasonal_stats_md = tabulate(
-        seasonal_stats, headers="keys", tablefmt="pipe", showindex=True
-    )
-
-    report_content = [
-        "# Weather Data Analysis Report (2017)",
-        "## 1. Introduction",
-        "This report summarizes the analysis of IMD weather data for 2017, focusing on trends in maximum temperature, rainfall, and humidity. This analysis supports climate awareness and sustainability initiatives.",
-        "",
-        "## 2. Data and Methodology",
-        f"The data was sourced from the {INPUT_FILE_NAME} file. Missing temperature and humidity values were imputed with the column mean, and missing rainfall records were treated as **0mm**.",
-        f"The final dataset contains {len(df_clean)} daily records.",
-        "",
-        "## 3. Key Statistical Findings",
-        "### Overall Statistics",
-        f"* **Overall Mean Maximum Temperature**: {stats_summary['Overall Mean Temperature']:.2f} °C",
-        f"* **Overall Maximum Temperature**: {stats_summary['Overall Max Temperature']:.2f} °C",
-        f"* **Overall Std Dev of Humidity**: {stats_summary['Overall Std Dev of Humidity']:.2f} %",
-        "",
-        "### Seasonal Trends",
-        "The seasonal grouping highlights major differences in climate patterns:",
-        seasonal_stats_md,
-        f"\n**Interpretation:** **{seasonal_stats.index[0]}** was the warmest season with the highest mean maximum temperature ({seasonal_stats.iloc[0]['Mean_Max_Temp']:.2f}°C). Total rainfall was highest during **{seasonal_stats['Total_Rainfall'].idxmax()}**.",
-        "",
-        "## 4. Visualized Insights",
-        "Visualizations were created to illustrate the trends and anomalies:",
-        "",
-        "### Daily Maximum Temperature Trend (Line Chart)",
-        f"Shows the daily variation in maximum temperature over the year. The peaks clearly correspond to the warmest months.",
-        f"![Daily Temperature Line Chart]({os.path.basename(plot_paths[0])})",
-        "",
-        "### Monthly Rainfall Totals (Bar Chart)",
-        f"Indicates months with the highest cumulative rainfall, which is critical for local water management.",
-        f"![Monthly Rainfall Bar Chart]({os.path.basename(plot_paths[1])})",
-        "",
-        "### Temperature vs. Humidity (Scatter Plot)",
-        f"This plot shows the relationship between temperature and humidity. A **weak negative correlation** is often observed.",
-        f"![Temperature vs. Humidity Scatter Plot]({os.path.basename(plot_paths[2])})",
-        "",
-        "### Daily Max Temperature and Rainfall (Combined Plot)",
-        f"A multi-axis plot combining the maximum temperature trend with daily rainfall volumes to illustrate correlation.",
-        f"![Combined Temperature and Rainfall Plot]({os.path.basename(plot_paths[3])})",
-        "",
-        "---",
-        "**Conclusion:** The analysis successfully used real-world data to identify seasonal temperature and rainfall patterns, fulfilling the assignment requirements.",
-    ]
-
-    with open(report_path, "w") as f:
-        f.write("\n".join(report_content))
-
-    print(f"Summary Report exported to: {report_path}")
-    print("\n--- Script Execution Complete ---")
-
-
-# --- Main Execution Block ---
 if __name__ == "__main__":
-
-    # 1. Load Data (uses the uploaded Max_Temp_IMD_2017.csv)
-    df = load_data(INPUT_FILE_NAME)
-    if df is None:
-        exit()
-
-    # 2. Clean Data
-    df_clean = clean_data(df)
-
-    # 3. Analyze Statistics
-    stats_summary = analyze_statistics(df_clean)
-
-    # 4. Visualize Data
-    plot_paths = create_visualizations(df_clean, OUTPUT_DIR)
-
-    # 5. Group and Aggregate
-    seasonal_stats = group_and_aggregate(df_clean)
-
-    # 6. Export Results and Storytelling
-    export_results(df_clean, stats_summary, seasonal_stats, plot_paths, OUTPUT_DIR)
-
-    # Submission Checklist Reminder
-    print(
-        "\n**SUCCESS!** All required files have been generated in the 'weather_visualizer_output' directory."
-    )
-    
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,10 @@
+"""Runs the campus energy and weather analyses as one DAG of stages.
+
+    python -m campus_analytics [energy|weather|all] [--from STAGE] [--only STAGE]
+
+Each stage's result is cached under .pipeline_cache, keyed by its
+parameters, code, input files and upstream stages, so a rerun only
+repeats the stages something changed for.
+"""
+
+from .dag import Stage, Pipeline
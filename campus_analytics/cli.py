@@ -0,0 +1,75 @@
+import argparse
+import sys
+import time
+
+from .dag import Pipeline
+from .projects import ENERGY_DATA_DIR, WEATHER_FILE
+
+
+def build_pipeline(args):
+    # imported here so --help doesn't load pandas
+    from .pipelines import energy_stages, weather_stages, joint_stages
+
+    stages = []
+    if args.pipeline in ("energy", "all"):
+        stages += energy_stages(args.energy_data, args.energy_output, args.dedup, args.freq,
+                                'interpolate' if args.fill_gaps else None)
+    if args.pipeline in ("weather", "all"):
+        stages += weather_stages(args.weather_file, args.weather_output)
+    if args.pipeline == "all":
+        stages += joint_stages(args.energy_output, args.align, args.base_temp)
+    return Pipeline(stages, args.cache_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run the energy / weather pipelines, rerunning only stages whose inputs changed")
+    parser.add_argument("pipeline", nargs="?", choices=["energy", "weather", "all"], default="all")
+    parser.add_argument("--from", dest="start", nargs="+", metavar="STAGE",
+                        help="rerun these stages and everything downstream of them")
+    parser.add_argument("--only", nargs="+", metavar="STAGE",
+                        help="rerun just these stages, reading their inputs from the cache")
+    parser.add_argument("--target", nargs="+", metavar="STAGE",
+                        help="stop once these stages (and what they read) are up to date")
+    parser.add_argument("--jobs", type=int, default=4, help="stages run at the same time")
+    parser.add_argument("--cache-dir", default=".pipeline_cache")
+    parser.add_argument("--list", action="store_true", help="list the stages and what they would do")
+    parser.add_argument("--energy-data", default=ENERGY_DATA_DIR)
+    parser.add_argument("--energy-output", default="output")
+    parser.add_argument("--dedup", choices=["last", "mean", "max"],
+                        help="resolve repeated meter timestamps this way instead of quarantining them")
+    parser.add_argument("--freq", help="meter reading interval (default: inferred)")
+    parser.add_argument("--fill-gaps", action="store_true", help="interpolate missing meter readings")
+    parser.add_argument("--weather-file", default=WEATHER_FILE)
+    parser.add_argument("--weather-output", default="weather_visualizer_output")
+    parser.add_argument("--align", choices=["none", "year", "start"], default="none",
+                        help="how weather dates are matched to the metering period; the "
+                             "sample weather and energy files cover different years, use "
+                             "'start' or 'year' to compare them anyway")
+    parser.add_argument("--base-temp", type=float, default=18.0, help="degree day base (C)")
+    args = parser.parse_args(argv)
+    args.align = None if args.align == "none" else args.align
+
+    pipeline = build_pipeline(args)
+    try:
+        if args.list:
+            _, run, load = pipeline.plan(args.target, args.start, args.only)
+            width = max(len(name) for name in pipeline.order)
+            for name in pipeline.order:
+                action = "run" if name in run else "cached" if name in load else "-"
+                inputs = ", ".join(pipeline.stages[name].inputs) or "files"
+                print(f"{name:<{width}}  {action:<7} <- {inputs}")
+            return 0
+        started = time.perf_counter()
+        pipeline.run(args.target, args.start, args.only, jobs=args.jobs)
+    except KeyError as error:
+        parser.error(error.args[0])
+
+    print("\n--- Stage Timings ---")
+    print(pipeline.report())
+    print(f"Total: {time.perf_counter() - started:.3f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+import hashlib
+import inspect
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+
+# A stage's key is a hash of its name, parameters, code, input files and the
+# keys of the stages it reads from, so keys are known before anything runs
+# and a stage is rerun only when something upstream of it really changed.
+
+
+class Stage:
+    """One step of a pipeline.
+
+    func is called with the outputs of the `inputs` stages as keyword
+    arguments (named after those stages) plus `params`, and returns the
+    stage's value, which is pickled into the cache. `files` lists the input
+    files (or a callable returning them) whose size and mtime go into the
+    key, `code` the modules (or source files) besides func's own whose
+    source does. A stage with `artifacts`
+    returns the paths it wrote; its cached value only counts while those
+    files exist. Stages sharing a `resource` (e.g. "matplotlib") never run
+    at the same time.
+    """
+
+    def __init__(self, name, func, inputs=(), params=None, files=(), code=(),
+                 artifacts=False, resource=None):
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.params = params or {}
+        self.files = files
+        self.code = (inspect.getmodule(func),) + tuple(code)
+        self.artifacts = artifacts
+        self.resource = resource
+
+    def input_files(self):
+        files = self.files() if callable(self.files) else self.files
+        return sorted(Path(f) for f in files)
+
+    def __repr__(self):
+        return f"Stage({self.name!r}, inputs={self.inputs})"
+
+
+def _source_digest(module):
+    path = module if isinstance(module, (str, Path)) else getattr(module, "__file__", None)
+    if path and os.path.exists(path):
+        with open(path, "rb") as file:
+            return hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+    return getattr(module, "__name__", repr(module))
+
+
+class Pipeline:
+    """A DAG of stages with results memoized on disk by their key."""
+
+    def __init__(self, stages, cache_dir=".pipeline_cache"):
+        self.stages = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate stage name {stage.name!r}")
+            self.stages[stage.name] = stage
+        for stage in self.stages.values():
+            for name in stage.inputs:
+                if name not in self.stages:
+                    raise ValueError(f"Stage {stage.name!r} reads unknown stage {name!r}")
+        self.order = self._topological_order()
+        self.cache_dir = Path(cache_dir)
+        self.timings = []
+
+    def _topological_order(self):
+        order, state = [], {}
+
+        def visit(name, path):
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Cycle in pipeline: {' -> '.join(path + [name])}")
+            state[name] = "visiting"
+            for dependency in self.stages[name].inputs:
+                visit(dependency, path + [name])
+            state[name] = "done"
+            order.append(name)
+
+        for name in self.stages:
+            visit(name, [])
+        return order
+
+    def resolve(self, name):
+        """Full stage name for `name`, which may leave out a 'prefix.'."""
+        if name in self.stages:
+            return name
+        matches = [s for s in self.stages if s.rsplit(".", 1)[-1] == name]
+        if len(matches) != 1:
+            known = ", ".join(self.order)
+            raise KeyError(f"{'Ambiguous' if matches else 'Unknown'} stage {name!r} (stages: {known})")
+        return matches[0]
+
+    def descendants(self, names):
+        found = set(names)
+        for name in self.order:
+            if any(i in found for i in self.stages[name].inputs):
+                found.add(name)
+        return found
+
+    def ancestors(self, names):
+        found, todo = set(), list(names)
+        while todo:
+            name = todo.pop()
+            if name not in found:
+                found.add(name)
+                todo.extend(self.stages[name].inputs)
+        return found
+
+    def keys(self):
+        keys = {}
+        for name in self.order:
+            stage = self.stages[name]
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(name.encode())
+            digest.update(repr(sorted(stage.params.items())).encode())
+            for module in stage.code:
+                digest.update(_source_digest(module).encode())
+            for path in stage.input_files():
+                info = path.stat()
+                digest.update(f"{path}:{info.st_size}:{info.st_mtime_ns}".encode())
+            for dependency in stage.inputs:
+                digest.update(keys[dependency].encode())
+            keys[name] = digest.hexdigest()
+        return keys
+
+    def _cache_path(self, name, key):
+        return self.cache_dir / f"{name}-{key}.pkl"
+
+    def _cached(self, name, key):
+        path = self._cache_path(name, key)
+        if not path.exists():
+            return False
+        if self.stages[name].artifacts:
+            with open(path, "rb") as file:
+                return all(Path(p).exists() for p in pickle.load(file))
+        return True
+
+    def sinks(self, names):
+        """The stages of `names` that no other stage of `names` reads."""
+        read = {i for n in names for i in self.stages[n].inputs}
+        return [n for n in self.order if n in names and n not in read]
+
+    def plan(self, targets=None, start=None, only=None):
+        """Returns (keys, stages to run, stages to load from the cache).
+
+        targets: stages wanted (default all). start: rerun these and every
+        stage downstream of them. only: rerun just these stages. Any other
+        stage is loaded from the cache when a stage that runs reads it, or
+        run as well when it has no valid cache entry.
+        """
+        keys = self.keys()
+        if only:
+            forced = {self.resolve(n) for n in only}
+            roots = forced
+        else:
+            wanted = self.ancestors({self.resolve(n) for n in targets} if targets else self.order)
+            forced = self.descendants({self.resolve(n) for n in start}) & wanted if start else set()
+            roots = self.sinks(wanted)
+
+        run, load = set(), set()
+        todo = list(roots)
+        while todo:
+            name = todo.pop()
+            if name in run or name in load:
+                continue
+            if name in forced or not self._cached(name, keys[name]):
+                run.add(name)
+                todo.extend(self.stages[name].inputs)
+            else:
+                load.add(name)
+        return keys, run, load
+
+    def run(self, targets=None, start=None, only=None, jobs=4):
+        """Runs the planned stages, independent ones concurrently, and
+        returns {stage: value} for every stage that was run or loaded."""
+        keys, run, load = self.plan(targets, start, only)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        values = {}
+        self.timings = []
+        for name in (n for n in self.order if n in load):
+            started = time.perf_counter()
+            with open(self._cache_path(name, keys[name]), "rb") as file:
+                values[name] = pickle.load(file)
+            self.timings.append((name, "cached", time.perf_counter() - started))
+
+        locks = {s.resource: threading.Lock() for s in self.stages.values() if s.resource}
+
+        def execute(name):
+            stage = self.stages[name]
+            arguments = {i.rsplit(".", 1)[-1]: values[i] for i in stage.inputs}
+            arguments.update(stage.params)
+            lock = locks.get(stage.resource)
+            if lock:
+                lock.acquire()
+            try:
+                started = time.perf_counter()
+                value = stage.func(**arguments)
+                elapsed = time.perf_counter() - started
+            finally:
+                if lock:
+                    lock.release()
+            path = self._cache_path(name, keys[name])
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            # only the latest entry of a stage is kept
+            for old in self.cache_dir.glob(f"{name}-*.pkl"):
+                if old != path:
+                    old.unlink()
+            return value, elapsed
+
+        pending = [n for n in self.order if n in run]
+        running = {}
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            while pending or running:
+                for name in list(pending):
+                    if all(i in values for i in self.stages[name].inputs):
+                        pending.remove(name)
+                        running[pool.submit(execute, name)] = name
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    values[name], elapsed = future.result()
+                    self.timings.append((name, "ran", elapsed))
+        return values
+
+    def report(self):
+        if not self.timings:
+            return "Nothing to run, every stage is up to date."
+        width = max(len(name) for name, _, _ in self.timings)
+        lines = [f"{'Stage':<{width}}  Status  Seconds"]
+        for name, status, seconds in self.timings:
+            lines.append(f"{name:<{width}}  {status:<6}  {seconds:7.3f}")
+        return "\n".join(lines)
@@ -0,0 +1,148 @@
+from pathlib import Path
+
+from .dag import Stage
+from . import weather_energy
+from .projects import add_project_paths
+
+add_project_paths()
+
+import campus_energy
+from campus_energy import BuildingManager, models as energy_models, store as energy_store, \
+    validation as energy_validation
+import weather_analysis
+from weather_analysis import data as weather_data, stats as weather_stats
+
+# Stage functions take the values of the stages they read (named after
+# them) and never modify those in place: independent stages get the same
+# objects and may run at the same time.
+
+ENERGY_DASHBOARD_SOURCE = Path(campus_energy.__file__).parent / "dashboard.py"
+WEATHER_PLOTS_SOURCE = Path(weather_analysis.__file__).parent / "plots.py"
+WEATHER_REPORT_SOURCE = Path(weather_analysis.__file__).parent / "report.py"
+
+
+# --- Campus energy: ingest -> process -> (dashboard, reports) ---
+
+def _manager(settings, **state):
+    manager = BuildingManager(**settings)
+    for name, value in state.items():
+        setattr(manager, name, value)
+    return manager
+
+
+def energy_ingest(**settings):
+    manager = _manager(settings)
+    manager.ingest_data()
+    if manager.df_combined.empty:
+        raise RuntimeError("No data ingested: " + "; ".join(manager.log_messages))
+    return {"df_combined": manager.df_combined, "log_messages": manager.log_messages,
+            "quarantine": manager.quarantine}
+
+
+def energy_process(ingest, **settings):
+    manager = _manager(settings, df_combined=ingest["df_combined"])
+    manager.process_data()
+    return {"daily_trends": manager.daily_trends, "weekly_means": manager.weekly_means,
+            "weekly_totals": manager.weekly_totals, "daily_coverage": manager.daily_coverage,
+            "weekly_coverage": manager.weekly_coverage, "hourly_peak": manager.hourly_peak,
+            "summary_table": manager.summary_table, "buildings": manager.buildings}
+
+
+def energy_dashboard(process, **settings):
+    manager = _manager(settings, daily_trends=process["daily_trends"], weekly_means=process["weekly_means"],
+                       hourly_peak=process["hourly_peak"])
+    path = manager.generate_visual_dashboard()
+    return [path] if path else []
+
+
+def energy_reports(ingest, process, **settings):
+    manager = _manager(settings, df_combined=ingest["df_combined"],
+                       log_messages=list(ingest["log_messages"]), quarantine=ingest["quarantine"],
+                       **process)
+    return manager.generate_reports()
+
+
+def energy_stages(data_dir, output_dir, dedup=None, freq=None, fill=None):
+    params = {"data_dir": str(data_dir), "output_dir": str(output_dir),
+              "dedup": dedup, "freq": freq, "fill": fill}
+    return [
+        Stage("energy.ingest", energy_ingest, params=params,
+              files=lambda: Path(data_dir).glob("*.csv"), code=[energy_models, energy_validation]),
+        Stage("energy.process", energy_process, ["energy.ingest"], params, code=[energy_models]),
+        Stage("energy.dashboard", energy_dashboard, ["energy.process"], params,
+              code=[ENERGY_DASHBOARD_SOURCE], artifacts=True, resource="matplotlib"),
+        Stage("energy.reports", energy_reports, ["energy.ingest", "energy.process"], params,
+              code=[energy_models, energy_store], artifacts=True),
+    ]
+
+
+# --- Weather: load -> clean -> (stats, visualize, group) -> export ---
+
+def weather_load(input_file):
+    df = weather_data.load_data(input_file)
+    if df is None:
+        raise FileNotFoundError(input_file)
+    return df
+
+
+def weather_clean(load):
+    return weather_data.clean_data(load.copy())
+
+
+def weather_statistics(clean):
+    return weather_stats.analyze_statistics(clean)
+
+
+def weather_visualize(clean, output_dir):
+    return weather_analysis.create_visualizations(clean, output_dir)
+
+
+def weather_group(clean):
+    return weather_stats.group_and_aggregate(clean.copy())
+
+
+def weather_export(clean, stats, group, visualize, output_dir):
+    # weather.group works on a copy, so the Season column the standalone
+    # analyzer leaves in the cleaned data is added here
+    clean = weather_stats.add_season(clean.copy())
+    return weather_analysis.export_results(clean, stats, group, visualize, output_dir)
+
+
+def weather_stages(input_file, output_dir):
+    output = {"output_dir": str(output_dir)}
+    return [
+        Stage("weather.load", weather_load, params={"input_file": str(input_file)},
+              files=[input_file], code=[weather_data]),
+        Stage("weather.clean", weather_clean, ["weather.load"], code=[weather_data]),
+        Stage("weather.stats", weather_statistics, ["weather.clean"], code=[weather_stats]),
+        Stage("weather.visualize", weather_visualize, ["weather.clean"], output,
+              code=[WEATHER_PLOTS_SOURCE], artifacts=True, resource="matplotlib"),
+        Stage("weather.group", weather_group, ["weather.clean"], code=[weather_stats]),
+        Stage("weather.export", weather_export,
+              ["weather.clean", "weather.stats", "weather.group", "weather.visualize"], output,
+              code=[WEATHER_REPORT_SOURCE, weather_stats], artifacts=True),
+    ]
+
+
+# --- Both: daily kWh of every building against the weather ---
+
+def weather_energy_models(process, clean, output_dir, align, base):
+    energy = weather_energy.daily_energy(process["daily_trends"], process["daily_coverage"])
+    weather = weather_energy.align_weather(clean, energy.index, align)
+    models = weather_energy.fit_degree_day_models(energy, weather, base)
+    print("\n--- Daily kWh vs. Degree Days (base %.1f C) ---" % base)
+    print(models.to_string(float_format="%.3f"))
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / "weather_energy_models.csv"
+    models.to_csv(path)
+    print(f"Degree day models saved to {path}.")
+    return [path]
+
+
+def joint_stages(output_dir, align=None, base=weather_energy.BASE_TEMP_C):
+    params = {"output_dir": str(output_dir), "align": align, "base": base}
+    return [
+        Stage("joint.weather_energy", weather_energy_models, ["energy.process", "weather.clean"],
+              params, code=[weather_energy], artifacts=True),
+    ]
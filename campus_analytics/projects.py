@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+# The two analyzers live in their own project folders (one with a space in
+# its name), so they are put on sys.path rather than installed.
+
+ROOT = Path(__file__).resolve().parent.parent
+ENERGY_PROJECT = ROOT / "CAPSTONE ASSIGNMENT"
+WEATHER_PROJECT = ROOT / "Weather_Analyzer"
+
+ENERGY_DATA_DIR = ENERGY_PROJECT / "DATA"
+WEATHER_FILE = WEATHER_PROJECT / "Max_Temp_IMD_2017.csv"
+
+
+def add_project_paths():
+    for path in (ENERGY_PROJECT, WEATHER_PROJECT):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
@@ -0,0 +1,33 @@
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from campus_analytics import cli
+from campus_analytics.projects import WEATHER_FILE, add_project_paths
+
+add_project_paths()
+
+from weather_analysis import cli as weather_cli
+from weather_analysis.config import CLEANED_FILE_NAME, REPORT_FILE_NAME
+
+
+class WeatherPipelineTest(unittest.TestCase):
+    def test_dag_output_matches_the_standalone_analyzer(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            with contextlib.redirect_stdout(io.StringIO()):
+                weather_cli.main([str(WEATHER_FILE), "--output-dir", str(tmp / "legacy")])
+                cli.main(["weather", "--weather-file", str(WEATHER_FILE),
+                          "--weather-output", str(tmp / "dag"), "--cache-dir", str(tmp / "cache")])
+
+            self.assertEqual(sorted(p.name for p in (tmp / "dag").iterdir()),
+                             sorted(p.name for p in (tmp / "legacy").iterdir()))
+            for name in (CLEANED_FILE_NAME, REPORT_FILE_NAME):
+                self.assertEqual((tmp / "dag" / name).read_text(), (tmp / "legacy" / name).read_text(), name)
+            self.assertIn("Season", (tmp / "dag" / CLEANED_FILE_NAME).read_text().splitlines()[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
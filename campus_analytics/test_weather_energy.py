@@ -0,0 +1,46 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from campus_analytics import weather_energy
+
+
+class MissingDayTest(unittest.TestCase):
+    def setUp(self):
+        days = pd.date_range("2024-07-01", periods=10, freq="D")
+        temperature = np.array([15, 20, 25, 12, 30, 22, 10, 28, 19, 24], dtype=np.float64)
+        self.weather = pd.DataFrame({"Max_Temp_C": temperature, "Humidity_Pct": 50.0,
+                                     "Rainfall_mm": 0.0}, index=days)
+        kwh = 100 + 5 * np.maximum(temperature - 18, 0) + 2 * np.maximum(18 - temperature, 0)
+        # the meter sent nothing on the fifth day, resample().sum() makes that 0 kWh
+        kwh[4] = 0
+        self.daily_trends = pd.DataFrame({"Hall_Daily": kwh}, index=days)
+        coverage = np.ones(10)
+        coverage[4] = 0
+        self.daily_coverage = pd.DataFrame({"Hall_Coverage": coverage}, index=days)
+
+    def test_day_without_readings_is_left_out(self):
+        energy = weather_energy.daily_energy(self.daily_trends, self.daily_coverage)
+        self.assertEqual(list(energy.columns), ["Hall"])
+        self.assertTrue(np.isnan(energy["Hall"].iloc[4]))
+
+        models = weather_energy.fit_degree_day_models(energy, self.weather)
+        hall = models.loc["Hall"]
+        self.assertEqual(hall["Days"], 9)
+        np.testing.assert_allclose(hall[["Base_kwh", "Kwh_per_CDD", "Kwh_per_HDD", "R2"]],
+                                   [100, 5, 2, 1], atol=1e-9)
+
+    def test_day_outside_the_coverage_is_left_out(self):
+        energy = weather_energy.daily_energy(self.daily_trends, self.daily_coverage.iloc[5:])
+        self.assertEqual(int(energy["Hall"].notna().sum()), 5)
+
+    def test_zero_day_skews_the_fit_without_coverage(self):
+        energy = weather_energy.daily_energy(self.daily_trends)
+        models = weather_energy.fit_degree_day_models(energy, self.weather)
+        self.assertEqual(models.loc["Hall", "Days"], 10)
+        self.assertLess(models.loc["Hall", "R2"], 0.9)
+
+
+if __name__ == "__main__":
+    unittest.main()
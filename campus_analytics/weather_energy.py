@@ -0,0 +1,187 @@
+import numpy as np
+import pandas as pd
+
+# Joins building energy use to the weather of the same day and fits, for
+# every building at once, kWh = base + cooling * CDD + heating * HDD.
+#
+# Energy is handled as a wide frame (one column per building, one row per
+# day or hour) so that thousands of buildings share a single time index:
+# the weather is looked up once per timestamp with a binary search on the
+# two sorted indexes, never joined row by row, and the regressions are
+# solved as one batch of 3x3 systems.
+
+BASE_TEMP_C = 18.0
+TEMP_COL = "Max_Temp_C"
+WEATHER_COLS = ["Max_Temp_C", "Humidity_Pct", "Rainfall_mm"]
+
+
+def degree_days(temperature, base=BASE_TEMP_C):
+    """Cooling and heating degree days of daily temperatures (°C).
+
+    The weather data only has the daily maximum, so that is used in place
+    of the usual daily mean; the base temperature can be raised to suit.
+    """
+    temperature = np.asarray(temperature, dtype=np.float64)
+    return pd.DataFrame({
+        "CDD": np.maximum(temperature - base, 0),
+        "HDD": np.maximum(base - temperature, 0),
+    })
+
+
+def _drop_suffix(frame, suffix):
+    return frame.rename(columns=lambda c: c[:-len(suffix)] if c.endswith(suffix) else c)
+
+
+def daily_energy(daily_trends, daily_coverage=None):
+    """BuildingManager.daily_trends with the '_Daily' suffix dropped.
+
+    The daily trends are sums, so a day without a single reading shows up
+    as 0 kWh. Given BuildingManager.daily_coverage, those days (and days
+    it doesn't cover) become NaN instead and stay out of the fits.
+    """
+    energy = _drop_suffix(daily_trends, "_Daily")
+    if daily_coverage is None:
+        return energy
+    coverage = _drop_suffix(daily_coverage, "_Coverage").reindex(index=energy.index,
+                                                                 columns=energy.columns)
+    return energy.where(coverage > 0)
+
+
+def hourly_energy(df_combined, timestamp_col="Timestamp", kwh_col="Energy_kwh"):
+    """Wide hourly kWh (timestamps x buildings) from the combined readings."""
+    return df_combined.pivot_table(index=timestamp_col, columns="Building",
+                                   values=kwh_col, aggfunc="sum").sort_index()
+
+
+def to_daily(energy):
+    """Daily kWh totals of wide hourly (or finer) energy readings."""
+    return energy.resample("D").sum(min_count=1)
+
+
+def align_weather(weather, energy_index, align=None):
+    """Moves the weather dates onto the energy period.
+
+    align=None keeps the dates, "year" moves every day to the same month
+    and day of the energy's first year, "start" shifts the whole series so
+    its first day is the energy's first day (for comparing a sample year
+    of weather with metering from another period).
+    """
+    weather = weather.sort_index()
+    if align is None or weather.empty or len(energy_index) == 0:
+        return weather
+    first = pd.Timestamp(energy_index.min()).normalize()
+    if align == "start":
+        return weather.set_axis(weather.index + (first - weather.index[0].normalize()))
+    if align == "year":
+        # Feb 29 has no match in a common year and is dropped
+        keep = ~((weather.index.month == 2) & (weather.index.day == 29)) | first.is_leap_year
+        weather = weather[keep]
+        moved = pd.to_datetime({"year": first.year, "month": weather.index.month,
+                                "day": weather.index.day})
+        return weather.set_axis(pd.DatetimeIndex(moved)).sort_index()
+    raise ValueError(f"Unknown alignment {align!r}, expected None, 'year' or 'start'")
+
+
+def asof_positions(index, source_index, tolerance=pd.Timedelta(days=1)):
+    """Position in source_index of the last entry at or before each entry
+    of index, -1 where there is none within tolerance. Both sorted."""
+    # compared as integer nanoseconds, the two indexes may differ in unit
+    times = pd.DatetimeIndex(index).to_numpy().astype("datetime64[ns]").view(np.int64)
+    source = pd.DatetimeIndex(source_index).to_numpy().astype("datetime64[ns]").view(np.int64)
+    positions = np.searchsorted(source, times, side="right") - 1
+    found = positions >= 0
+    gap = times - source[np.maximum(positions, 0)]
+    found &= gap < pd.Timedelta(tolerance).value
+    return np.where(found, positions, -1)
+
+
+def weather_for(index, weather, tolerance=pd.Timedelta(days=1), base=BASE_TEMP_C):
+    """Weather (plus CDD / HDD) of each timestamp of index, NaN where no
+    weather row lies within tolerance before it."""
+    weather = weather.sort_index()
+    positions = asof_positions(index, weather.index, tolerance)
+    values = weather[WEATHER_COLS].to_numpy(np.float64)[np.maximum(positions, 0)]
+    values[positions < 0] = np.nan
+    joined = pd.DataFrame(values, index=index, columns=WEATHER_COLS)
+    days = degree_days(joined[TEMP_COL].to_numpy(), base)
+    joined["CDD"] = days["CDD"].to_numpy()
+    joined["HDD"] = days["HDD"].to_numpy()
+    joined.loc[positions < 0, ["CDD", "HDD"]] = np.nan
+    return joined
+
+
+def join_energy_weather(energy, weather, tolerance=pd.Timedelta(days=1), base=BASE_TEMP_C):
+    """Long table of Timestamp, Building, kWh and that time's weather.
+
+    energy is wide (daily or hourly rows, one column per building). Each
+    energy row matches at most one weather row, so the result has one row
+    per (timestamp, building) reading; rows without weather are dropped.
+    """
+    energy = energy.sort_index()
+    conditions = weather_for(energy.index, weather, tolerance, base)
+    n_times, n_buildings = energy.shape
+    kwh = energy.to_numpy(np.float64).ravel()
+    rows = np.repeat(np.arange(n_times), n_buildings)
+    joined = pd.DataFrame({
+        "Timestamp": energy.index.to_numpy()[rows],
+        "Building": np.tile(energy.columns.to_numpy(), n_times),
+        "kWh": kwh,
+    })
+    for column in conditions.columns:
+        joined[column] = conditions[column].to_numpy()[rows]
+    return joined[~np.isnan(kwh) & ~np.isnan(joined[TEMP_COL].to_numpy())].reset_index(drop=True)
+
+
+def fit_degree_day_models(energy_daily, weather, base=BASE_TEMP_C, tolerance=pd.Timedelta(days=1)):
+    """Least squares fit of daily kWh = base + cooling * CDD + heating * HDD
+    for every building (column of energy_daily) at once.
+
+    Days without a reading for a building are left out of that building's
+    fit only. A term with no spread (e.g. no heating days at all) gets a
+    coefficient of 0 rather than failing the fit.
+    """
+    energy_daily = energy_daily.sort_index()
+    conditions = weather_for(energy_daily.index, weather, tolerance, base)
+    y = energy_daily.to_numpy(np.float64)                       # days x buildings
+    x = np.column_stack([np.ones(len(conditions)), conditions["CDD"], conditions["HDD"]])
+    usable = ~np.isnan(y) & ~np.isnan(x).any(axis=1)[:, None]   # days x buildings
+    x = np.nan_to_num(x)
+    y_masked = np.where(usable, y, 0.0)
+    w = usable.astype(np.float64)
+
+    # normal equations of every building: (X' W X) beta = X' W y
+    xtx = np.einsum("db,di,dj->bij", w, x, x)
+    xty = np.einsum("db,di->bi", y_masked, x)
+    beta = np.einsum("bij,bj->bi", np.linalg.pinv(xtx), xty)
+
+    days = w.sum(axis=0)
+    beta[days == 0] = np.nan
+    fitted = x @ beta.T
+    residual = np.where(usable, y - fitted, 0.0)
+    mean = np.divide(y_masked.sum(axis=0), days, out=np.zeros_like(days), where=days > 0)
+    total = (np.where(usable, y - mean, 0.0) ** 2).sum(axis=0)
+    sse = (residual ** 2).sum(axis=0)
+    r2 = np.divide(total - sse, total, out=np.full_like(total, np.nan), where=total > 0)
+
+    return pd.DataFrame({
+        "Days": days.astype(np.int64),
+        "Base_kwh": beta[:, 0],
+        "Kwh_per_CDD": beta[:, 1],
+        "Kwh_per_HDD": beta[:, 2],
+        "R2": r2,
+        "Temp_Correlation": _correlation(y, conditions[TEMP_COL].to_numpy(), usable),
+    }, index=energy_daily.columns.rename("Building"))
+
+
+def _correlation(y, temperature, usable):
+    """Pearson correlation of every building's kWh with temperature."""
+    w = usable.astype(np.float64)
+    n = w.sum(axis=0)
+    t = np.nan_to_num(temperature)[:, None] * w
+    y = np.where(usable, y, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_t, mean_y = t.sum(axis=0) / n, y.sum(axis=0) / n
+        cov = (t * y).sum(axis=0) / n - mean_t * mean_y
+        var_t = (t * t).sum(axis=0) / n - mean_t ** 2
+        var_y = (y * y).sum(axis=0) / n - mean_y ** 2
+        return cov / np.sqrt(var_t * var_y)